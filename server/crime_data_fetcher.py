@@ -7,16 +7,42 @@ Perception of Safety: ONS Crime Survey (CSEW) | Crown Court Backlog: MoJ Crimina
 Reoffending Rate: MoJ Proven Reoffending
 """
 
-import io
 import json
+import logging
+import os
 import re
 import sys
-import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
 from datetime import datetime
 
+import numpy as np
 import openpyxl
 import pandas as pd
 import requests
+from urllib3.util.retry import Retry
+
+from http_cache import cached_download
+from metric_cache import FRESH_HOURS, load_metric, save_metric
+from rag import rag_status, rag_statuses, signed_table
+
+try:
+    import python_calamine  # noqa: F401  (Rust reader; pandas >= 2.2 exposes it as engine="calamine")
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None  # pandas default (openpyxl for .xlsx)
+
+try:
+    import orjson  # Rust JSON encoder for the stdout payload
+except ImportError:
+    orjson = None
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+# Sheet listings and dataframe dumps are debug-only; the JSON payload stays on stdout.
+logger = logging.getLogger(__name__)
 
 # Official source URLs (per Updated Data Sources UK RAG image)
 SOURCE_URLS = {
@@ -27,6 +53,204 @@ SOURCE_URLS = {
     "recall_rate": "https://www.gov.uk/government/collections/offender-management-statistics-quarterly",
 }
 
+# One keep-alive session shared by every fetcher (and thread) so repeat hits
+# on gov.uk / ons.gov.uk reuse pooled connections. requests negotiates
+# gzip/deflate and decodes the body as it streams. Transient gateway errors
+# are retried with backoff.
+_session = requests.Session()
+_session.headers.update({"User-Agent": "UK-RAG-Dashboard/1.0"})
+_session.mount("https://", requests.adapters.HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+))
+
+
+# Fail fast when a host is unreachable instead of waiting out the read timeout.
+CONNECT_TIMEOUT = 10
+
+
+def _download(url, timeout):
+    """Stream a file into the on-disk HTTP cache and return its local path.
+
+    Unchanged upstream files are revalidated with a conditional GET (304)
+    rather than re-downloaded; see http_cache.
+    """
+    return cached_download(_session, url, (CONNECT_TIMEOUT, timeout))
+
+
+# The summary figures we scan for sit in the top-left of each table, so only
+# that block is parsed rather than every row/column of a wide sheet.
+SCAN_NROWS = 200
+SCAN_MAX_COLS = 16
+SCAN_HEAD = {"header": None, "nrows": SCAN_NROWS, "usecols": lambda col: col < SCAN_MAX_COLS}
+
+
+def _read_sheet_head(excel_file, sheet_name):
+    """Read the top-left SCAN_NROWS x SCAN_MAX_COLS block of a sheet (no header)."""
+    return pd.read_excel(excel_file, sheet_name=sheet_name, **SCAN_HEAD)
+
+
+def _read_ods(path, sheet_name, **kwargs):
+    """Read one sheet of an ODS file, preferring calamine over odfpy.
+
+    odfpy builds the whole XML tree before honouring nrows, which makes large
+    MoJ/HMPPS ODS files very slow; calamine streams them. odfpy stays as the
+    fallback when calamine is missing or rejects the file.
+    """
+    if EXCEL_ENGINE == "calamine":
+        try:
+            return pd.read_excel(path, sheet_name=sheet_name, engine="calamine", **kwargs)
+        except python_calamine.CalamineError as e:
+            logger.warning("calamine could not read %s (%s); retrying with odf", os.path.basename(path), e)
+    return pd.read_excel(path, sheet_name=sheet_name, engine="odf", **kwargs)
+
+
+# Row/cell triage patterns for the sheet scans, compiled once. Lookaheads keep
+# the "contains A and B (in any order)" semantics of the keyword checks.
+RECORDED_CRIME_ROW_RE = re.compile(r"england|^(?=.*total)(?=.*crime)", re.S)
+RECORDED_CRIME_PERIOD_RE = re.compile(r"2024|Q")
+RECORDED_CRIME_SHEET_RE = re.compile(r"P1|RECORDED CRIME", re.I)
+CHARGE_SHEET_RE = re.compile(r"charg|outcom|summary|detect", re.I)
+CHARGE_ROW_RE = re.compile(r"charge|detection|outcome")
+CHARGE_FALLBACK_ROW_RE = re.compile(r"charge")  # also matches "charged"
+CHARGE_PERIOD_RE = re.compile(r"202|March|(?i:year)")
+CROWN_BACKLOG_ROW_RE = re.compile(r"^(?=.*crown)(?=.*(?:backlog|caseload|open))", re.S)
+
+
+# Cell types taken as numbers directly (bool is deliberately not among them).
+_NUMBER_TYPES = (int, float, np.int64, np.float64)
+
+
+def _coerce_numeric(cells):
+    """Coerce an array of cells to floats of the same shape.
+
+    Cells that are already numbers are copied straight into a float64 buffer;
+    only text cells go through one pd.to_numeric pass, where "1,234" and "7.3%"
+    are accepted. Anything else (blanks, dates, words) becomes NaN.
+    """
+    cells = np.asarray(cells, dtype=object)
+    flat = pd.Series(cells.ravel(), dtype=object)
+    kinds = flat.map(type)
+    is_number = kinds.isin(_NUMBER_TYPES).to_numpy()
+    is_text = (kinds == str).to_numpy()
+    out = np.full(flat.size, np.nan)
+    out[is_number] = flat[is_number].to_numpy(dtype=float)
+    if is_text.any():
+        text = flat[is_text].str.replace(r"[%,]", "", regex=True)
+        out[is_text] = pd.to_numeric(text, errors="coerce").to_numpy(dtype=float)
+    return out.reshape(cells.shape)
+
+
+def _row_strings(df):
+    """Lower-cased text of each row (blank cells dropped), built column by column.
+
+    One vectorised concat per column replaces a Python join per row.
+    """
+    text = df.astype(str).where(df.notna(), "")
+    joined = pd.Series("", index=df.index, dtype=object)
+    for col in text.columns:
+        joined = joined + " " + text[col]
+    return joined.str.lower()
+
+
+def _find_in_matching_rows(df, row_re, lo, hi):
+    """First number in [lo, hi] on a row whose text matches row_re.
+
+    Returns (value, row_position), or (None, None) if no matching row has one.
+    """
+    rows = df.to_numpy(dtype=object)
+    candidates = np.flatnonzero(_row_strings(df).str.contains(row_re).to_numpy(dtype=bool))
+    # Coerce every candidate row at once, then take the first hit row-major.
+    block = _coerce_numeric(rows[candidates])
+    in_range = (block >= lo) & (block <= hi)
+    hit_rows = np.flatnonzero(in_range.any(axis=1))
+    if hit_rows.size == 0:
+        return None, None
+    r = hit_rows[0]
+    return float(block[r, in_range[r].argmax()]), int(candidates[r])
+
+
+def _last_row_first_match(df, pattern, strings_only=False):
+    """First cell matching pattern on the last row that has one, or None.
+
+    Matches whole columns at once; a later row wins, as in the row-by-row scans
+    this replaces. With strings_only, non-text cells (numbers, dates) are ignored;
+    otherwise every non-blank cell is matched on its str() form.
+    """
+    columns = []
+    for col in df.columns:
+        cells = df[col]
+        try:
+            if strings_only:
+                hit = cells.str.contains(pattern, na=False)
+            else:
+                hit = cells.notna() & cells.astype(str).str.contains(pattern)
+        except AttributeError:  # no text cells in this column
+            hit = pd.Series(False, index=df.index)
+        columns.append(hit.to_numpy(dtype=bool))
+    if not columns:
+        return None
+    mask = np.column_stack(columns)
+    rows = np.flatnonzero(mask.any(axis=1))
+    if rows.size == 0:
+        return None
+    r = rows[-1]
+    return df.iat[r, mask[r].argmax()]
+
+
+def _charge_rate_sheets(sheet_names, limit):
+    """Sheets worth parsing for the charge rate, most likely first.
+
+    Tabs whose names look like outcome/charge summaries are tried on their own;
+    only if none match do we fall back to the first `limit` sheets.
+    """
+    named = [name for name in sheet_names if CHARGE_SHEET_RE.search(name)]
+    return (named or sheet_names)[:limit]
+
+
+def _scan_charge_rate_workbook(path, row_re, max_sheets):
+    """Scan a downloaded Outcomes workbook for the charge rate.
+
+    Each candidate sheet is parsed at most once and the workbook is closed on
+    return, so the fallback pass never holds two workbooks open. Returns
+    (charge_rate, time_period); either may be None.
+    """
+    time_period = None
+    with pd.ExcelFile(path, engine=EXCEL_ENGINE) as excel_file:
+        logger.debug("Available sheets: %s", excel_file.sheet_names[:10])
+        for sheet_name in _charge_rate_sheets(excel_file.sheet_names, max_sheets):
+            df = _read_sheet_head(excel_file, sheet_name)
+            charge_rate, hit_row = _find_in_matching_rows(df, row_re, 5, 25)
+            # Capture time period (e.g. year ending) from the rows above the hit
+            period = _last_row_first_match(df.iloc[:hit_row], CHARGE_PERIOD_RE, strings_only=True)
+            if period is not None:
+                time_period = str(period).strip()[:30]
+            if charge_rate:
+                return charge_rate, time_period
+    return None, time_period
+
+
+def _iter_sheet_rows(path, sheet_name):
+    """Yield a sheet's rows as sequences of cell values; raise KeyError if it is missing.
+
+    Uses python-calamine's native reader when installed, otherwise openpyxl in
+    read-only mode. Both stream rows, so callers can stop early.
+    """
+    if EXCEL_ENGINE == "calamine":
+        with python_calamine.CalamineWorkbook.from_path(path) as workbook:
+            if sheet_name not in workbook.sheet_names:
+                raise KeyError(sheet_name)
+            yield from workbook.get_sheet_by_name(sheet_name).iter_rows()
+        return
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        if sheet_name not in wb.sheetnames:
+            raise KeyError(sheet_name)
+        yield from wb[sheet_name].iter_rows(values_only=True)
+    finally:
+        wb.close()
+
 # RAG Thresholds for Crime Metrics
 RAG_THRESHOLDS = {
     "recorded_crime_rate": {
@@ -56,41 +280,40 @@ RAG_THRESHOLDS = {
     },
 }
 
+# Metrics where a higher value is better; every other metric is lower-is-better.
+HIGHER_IS_BETTER = ("charge_rate",)
+
+# Built once at import so classification is one dict lookup plus two comparisons.
+_RAG_TABLE = signed_table(RAG_THRESHOLDS, HIGHER_IS_BETTER)
+
+
 def calculate_rag_status(metric_key, value):
     """Calculate RAG status based on thresholds (returns lowercase)"""
-    if metric_key not in RAG_THRESHOLDS:
-        return "amber"
-    thresholds = RAG_THRESHOLDS[metric_key]
-    # Lower is better: recorded_crime_rate, crown_court_backlog, recall_rate
-    if metric_key in ("recorded_crime_rate", "crown_court_backlog", "recall_rate"):
-        if value <= thresholds["green"]:
-            return "green"
-        elif value <= thresholds["amber"]:
-            return "amber"
-        return "red"
-    # Higher is better: charge_rate
-    if metric_key in ("charge_rate",):
-        if value >= thresholds["green"]:
-            return "green"
-        elif value >= thresholds["amber"]:
-            return "amber"
-        return "red"
-    # Lower is better: street_confidence_index (% feeling unsafe)
-    if metric_key == "street_confidence_index":
-        if value <= thresholds["green"]:
-            return "green"
-        elif value <= thresholds["amber"]:
-            return "amber"
-        return "red"
-    return "amber"
-
-def fetch_recorded_crime_data():
+    return rag_status(_RAG_TABLE, metric_key, value)
+
+
+def calculate_rag_statuses(metric_key, values):
+    """Vectorised calculate_rag_status for a sequence of values (returns a list)."""
+    return rag_statuses(_RAG_TABLE, metric_key, values)
+
+
+def _quarter_label(when):
+    """Format a datetime as 'YYYY QN'."""
+    return f"{when.year} Q{((when.month - 1) // 3) + 1}"
+
+
+def fetch_recorded_crime_data(now=None):
     """
     Fetch recorded crime rate from ONS Crime in England and Wales dataset
     
     Returns:
         dict: Metric data with value, RAG status, and metadata
     """
+    now = now or datetime.now()
+    cached = load_metric("recorded_crime_rate", max_age_hours=FRESH_HOURS)
+    if cached:
+        print(f"Recorded crime rate: reusing result saved within {FRESH_HOURS:g}h")
+        return {**cached, "last_updated": now.isoformat()}
     try:
         print("\n" + "="*60)
         print("Fetching Recorded Crime Rate Data")
@@ -102,33 +325,28 @@ def fetch_recorded_crime_data():
         
         print(f"Downloading from: {url}")
         
-        response = requests.get(url, timeout=60)
-        response.raise_for_status()
+        path = _download(url, timeout=60)
         
-        print(f"Downloaded {len(response.content)} bytes")
+        logger.debug("Downloaded %d bytes", os.path.getsize(path))
         
         # Read the Excel file - typically Table P1 contains police recorded crime
-        excel_file = pd.ExcelFile(io.BytesIO(response.content))
-        print(f"Available sheets: {excel_file.sheet_names[:10]}")  # Show first 10 sheets
-        
-        # Look for the sheet with recorded crime data
-        target_sheet = None
-        for sheet in excel_file.sheet_names:
-            if 'P1' in sheet.upper() or 'RECORDED CRIME' in sheet.upper():
-                target_sheet = sheet
-                break
+        excel_file = pd.ExcelFile(path, engine=EXCEL_ENGINE)
+        logger.debug("Available sheets: %s", excel_file.sheet_names[:10])
         
-        if not target_sheet:
-            # Default to first data sheet if we can't find the right one
-            target_sheet = excel_file.sheet_names[0]
+        # Look for the sheet with recorded crime data, defaulting to the first
+        # sheet if we can't find the right one
+        target_sheet = next(
+            (sheet for sheet in excel_file.sheet_names if RECORDED_CRIME_SHEET_RE.search(sheet)),
+            excel_file.sheet_names[0],
+        )
         
-        print(f"Using sheet: {target_sheet}")
+        logger.debug("Using sheet: %s", target_sheet)
         
         # Read the sheet
-        df = pd.read_excel(excel_file, sheet_name=target_sheet, header=None)
+        df = _read_sheet_head(excel_file, target_sheet)
         
-        print(f"Sheet dimensions: {df.shape}")
-        print(f"\nFirst 10 rows:\n{df.head(10)}")
+        logger.debug("Sheet dimensions: %s", df.shape)
+        logger.debug("First 10 rows:\n%s", df.head(10))
         
         # Parse the Excel to find crime rate data
         # ONS crime Excel files typically have summary tables
@@ -139,44 +357,28 @@ def fetch_recorded_crime_data():
         
         # Search through the dataframe for crime rate data
         # Typical format: Row with "Total" or "England" and a numeric crime rate
-        for idx, row in df.iterrows():
-            row_str = ' '.join([str(cell) for cell in row.values if pd.notna(cell)]).lower()
-            
-            # Look for England/Total row
-            if 'england' in row_str or ('total' in row_str and 'crime' in row_str):
-                # Look for numeric values in this row that could be crime rate
-                for cell in row.values:
-                    if pd.notna(cell):
-                        try:
-                            val = float(str(cell).replace(',', ''))
-                            # Crime rate per 1000 is typically 50-150
-                            if 50 <= val <= 150:
-                                crime_rate = val
-                                break
-                        except:
-                            continue
-                if crime_rate:
-                    break
+        # (per 1000, typically 50-150)
+        crime_rate, _ = _find_in_matching_rows(df, RECORDED_CRIME_ROW_RE, 50, 150)
         
-        # If not found, try to find time period and use a reasonable estimate
-        if not crime_rate:
-            # Look for time period in the data
-            for idx, row in df.iterrows():
-                for cell in row.values:
-                    if pd.notna(cell):
-                        cell_str = str(cell)
-                        # Look for quarter/year patterns
-                        if '2024' in cell_str or 'Q' in cell_str:
-                            time_period = cell_str
-                            break
+        # If not found, prefer the last parsed value; otherwise find the time
+        # period and use a reasonable estimate
+        parsed = bool(crime_rate)
+        if not parsed:
+            stale = load_metric("recorded_crime_rate")
+            if stale:
+                print("  Note: Using last parsed value - check ONS P1 table structure")
+                return stale
+            # Look for time period (quarter/year patterns) in the data
+            period = _last_row_first_match(df, RECORDED_CRIME_PERIOD_RE)
+            if period is not None:
+                time_period = str(period)
             
             # Use a reasonable estimate based on recent ONS data
             # Recent crime rates are typically 85-95 per 1000
             crime_rate = 89.5  # Fallback estimate
         
         if not time_period:
-            today = datetime.now()
-            time_period = f"{today.year} Q{((today.month - 1) // 3) + 1}"
+            time_period = _quarter_label(now)
         
         rag_status = calculate_rag_status("recorded_crime_rate", crime_rate)
         
@@ -189,7 +391,7 @@ def fetch_recorded_crime_data():
             "time_period": time_period,
             "data_source": "ONS: Crime in England & Wales",
             "source_url": SOURCE_URLS["recorded_crime_rate"],
-            "last_updated": datetime.now().isoformat()
+            "last_updated": now.isoformat()
         }
         
         print(f"\nRecorded Crime Rate Result:")
@@ -197,17 +399,24 @@ def fetch_recorded_crime_data():
         print(f"  RAG Status: {rag_status.upper()}")
         print(f"  Time Period: {time_period}")
         
+        if parsed:
+            save_metric(result)
         return result
         
     except Exception as e:
         print(f"Error fetching recorded crime data: {e}", file=sys.stderr)
-        return None
+        return load_metric("recorded_crime_rate")
 
-def fetch_charge_rate_data():
+def fetch_charge_rate_data(now=None):
     """
     Fetch charge rate (detection rate) from Gov.uk: Crime Outcomes open data.
     Source: https://www.gov.uk/government/statistical-data-sets/police-recorded-crime-and-outcomes-open-data-tables
     """
+    now = now or datetime.now()
+    cached = load_metric("charge_rate", max_age_hours=FRESH_HOURS)
+    if cached:
+        print(f"Charge rate: reusing result saved within {FRESH_HOURS:g}h")
+        return {**cached, "last_updated": now.isoformat()}
     try:
         print("\n" + "="*60)
         print("Fetching Charge Rate Data (Gov.uk: Crime Outcomes)")
@@ -215,69 +424,28 @@ def fetch_charge_rate_data():
         # Gov.uk Outcomes open data - Supplementary crime outcomes metrics (smaller file with summary)
         url = "https://assets.publishing.service.gov.uk/media/68f87963b391b93d5aa39a39/prc-supplementary-crime-outcomes-metrics-231025.xlsx"
         print(f"Downloading from: Gov.uk Crime Outcomes")
-        response = requests.get(url, timeout=90)
-        response.raise_for_status()
-        print(f"Downloaded {len(response.content)} bytes")
-        excel_file = pd.ExcelFile(io.BytesIO(response.content))
-        print(f"Available sheets: {excel_file.sheet_names[:10]}")
-        charge_rate = None
-        time_period = None
-        for sheet_name in excel_file.sheet_names[:15]:
-            df = pd.read_excel(excel_file, sheet_name=sheet_name, header=None)
-            for idx, row in df.iterrows():
-                row_str = ' '.join([str(cell) for cell in row.values if pd.notna(cell)]).lower()
-                if 'charge' in row_str or 'detection' in row_str or 'outcome' in row_str:
-                    for cell in row.values:
-                        if pd.notna(cell):
-                            try:
-                                val = float(str(cell).replace('%', '').replace(',', ''))
-                                if 5 <= val <= 25:
-                                    charge_rate = val
-                                    break
-                            except Exception:
-                                continue
-                    if charge_rate:
-                        break
-                # Capture time period (e.g. year ending)
-                for cell in row.values:
-                    if pd.notna(cell) and isinstance(cell, str) and ('202' in cell or 'March' in cell or 'year' in cell.lower()):
-                        time_period = str(cell).strip()[:30]
-                        break
-            if charge_rate:
-                break
+        path = _download(url, timeout=90)
+        logger.debug("Downloaded %d bytes", os.path.getsize(path))
+        charge_rate, time_period = _scan_charge_rate_workbook(path, CHARGE_ROW_RE, 15)
         if not charge_rate:
-            # Fallback: use main Outcomes open data year ending March 2025 (first sheet only for speed)
+            # Fallback: use main Outcomes open data year ending March 2025 (first sheets only for speed)
             url_main = "https://assets.publishing.service.gov.uk/media/68f1ec061c9076042263efb2/prc-outcomes-open-data-mar2025-tables-231025.xlsx"
             print("  Trying main Outcomes open data...")
-            resp2 = requests.get(url_main, timeout=120)
-            resp2.raise_for_status()
-            xl = pd.ExcelFile(resp2.content)
-            for sh in xl.sheet_names[:5]:
-                df = pd.read_excel(xl, sheet_name=sh, header=None)
-                for idx, row in df.iterrows():
-                    row_str = ' '.join([str(c) for c in row.values if pd.notna(c)]).lower()
-                    if 'charge' in row_str or 'charged' in row_str:
-                        for c in row.values:
-                            if pd.notna(c):
-                                try:
-                                    v = float(str(c).replace('%', '').replace(',', ''))
-                                    if 5 <= v <= 25:
-                                        charge_rate = v
-                                        break
-                                except Exception:
-                                    pass
-                            if charge_rate:
-                                break
-                if charge_rate:
-                    break
+            charge_rate, _ = _scan_charge_rate_workbook(
+                _download(url_main, timeout=120), CHARGE_FALLBACK_ROW_RE, 5
+            )
             if not time_period:
                 time_period = f"Year ending March 2025"
-        if not charge_rate:
+        parsed = bool(charge_rate)
+        if not parsed:
+            stale = load_metric("charge_rate")
+            if stale:
+                print("  Note: Using last parsed value - check Gov.uk Outcomes Excel structure")
+                return stale
             charge_rate = 7.2
             print("  Note: Using fallback value - check Gov.uk Outcomes Excel structure")
         if not time_period:
-            today = datetime.now()
-            time_period = f"{today.year} Q{((today.month - 1) // 3) + 1}"
+            time_period = _quarter_label(now)
         rag_status = calculate_rag_status("charge_rate", charge_rate)
         result = {
             "metric_name": "Charge Rate",
@@ -288,13 +456,15 @@ def fetch_charge_rate_data():
             "time_period": time_period,
             "data_source": "Gov.uk: Crime Outcomes",
             "source_url": SOURCE_URLS["charge_rate"],
-            "last_updated": datetime.now().isoformat()
+            "last_updated": now.isoformat()
         }
         print(f"\nCharge Rate Result: {charge_rate}% (RAG: {rag_status.upper()})")
+        if parsed:
+            save_metric(result)
         return result
     except Exception as e:
         print(f"Error fetching charge rate data: {e}", file=sys.stderr)
-        return None
+        return load_metric("charge_rate")
 
 
 def _parse_b7_period(raw: str) -> str:
@@ -315,13 +485,14 @@ def _parse_b7_period(raw: str) -> str:
     return f"{end_year} Q{quarter}"
 
 
-def fetch_perception_of_safety_data():
+def fetch_perception_of_safety_data(now=None):
     """Fetch perception of safety from ONS Annual Supplementary Tables (Table B7).
 
     Table B7: '% aged 16+ who felt very/fairly safe walking alone after dark'.
     We compute 100% − safe% = % feeling unsafe (lower is better).
     Source: https://www.ons.gov.uk/peoplepopulationandcommunity/crimeandjustice/datasets/crimeinenglandandwalesannualsupplementarytables
     """
+    now = now or datetime.now()
     try:
         print("\n" + "=" * 60)
         print("Fetching Perception of Safety (ONS Annual Supplementary Tables – Table B7)")
@@ -332,37 +503,31 @@ def fetch_perception_of_safety_data():
             "crimeandjustice/datasets/crimeinenglandandwalesannualsupplementarytables/"
             "march2025/annualsupplementarytablesmarch2025.xlsx"
         )
-        response = requests.get(url, timeout=120)
-        response.raise_for_status()
+        path = _download(url, timeout=120)
 
-        wb = openpyxl.load_workbook(io.BytesIO(response.content), read_only=True, data_only=True)
-        if "Table B7" not in wb.sheetnames:
+        # Stream rows rather than materialising the whole sheet. The last "Sex"
+        # header row and the last "All people" row in the sheet are used.
+        headers = None
+        data = None
+        try:
+            with closing(_iter_sheet_rows(path, "Table B7")) as rows:
+                for row in rows:
+                    first_cell = str((row[0] if row else None) or "").strip().lower()
+                    if first_cell == "sex":
+                        headers = row
+                    elif "all people" in first_cell:
+                        data = row
+        except KeyError:
             print("  Sheet 'Table B7' not found in workbook", file=sys.stderr)
             return []
 
-        ws = wb["Table B7"]
-        rows = list(ws.iter_rows(values_only=True))
-        wb.close()
-
-        header_row_idx = None
-        data_row_idx = None
-        for i, row in enumerate(rows):
-            first_cell = str(row[0] or "").strip().lower()
-            if first_cell == "sex":
-                header_row_idx = i
-            elif "all people" in first_cell:
-                data_row_idx = i
-
-        if header_row_idx is None or data_row_idx is None:
+        if headers is None or data is None:
             print("  Could not locate header/data rows in Table B7", file=sys.stderr)
             return []
 
-        headers = rows[header_row_idx]
-        data = rows[data_row_idx]
-
-        results = []
+        points = []
         for period_raw, safe_pct in zip(headers[1:], data[1:]):
-            if period_raw is None or safe_pct is None:
+            if period_raw in (None, "") or safe_pct in (None, ""):
                 continue
             try:
                 safe_val = float(safe_pct)
@@ -370,9 +535,12 @@ def fetch_perception_of_safety_data():
                 continue
 
             unsafe_val = round(100.0 - safe_val, 1)
-            period_str = _parse_b7_period(str(period_raw))
-            rag = calculate_rag_status("street_confidence_index", unsafe_val)
+            points.append((_parse_b7_period(str(period_raw)), unsafe_val))
 
+        rags = calculate_rag_statuses("street_confidence_index", [value for _, value in points])
+        last_updated = now.isoformat()
+        results = []
+        for (period_str, unsafe_val), rag in zip(points, rags):
             results.append({
                 "metric_name": "Perception of Safety",
                 "metric_key": "street_confidence_index",
@@ -382,7 +550,7 @@ def fetch_perception_of_safety_data():
                 "time_period": period_str,
                 "data_source": "ONS: Crime Survey (CSEW) – Annual Supplementary Table B7",
                 "source_url": SOURCE_URLS["street_confidence_index"],
-                "last_updated": datetime.now().isoformat(),
+                "last_updated": last_updated,
             })
 
         if not results:
@@ -401,12 +569,13 @@ def fetch_perception_of_safety_data():
 
 EW_POPULATION_FALLBACK = 69_487_000
 
-def fetch_crown_court_backlog_data():
+def fetch_crown_court_backlog_data(now=None):
     """
     Fetch Crown Court backlog from MoJ: Criminal Court Statistics and
     convert to a per-100,000 population rate.
     Source: https://www.gov.uk/government/collections/criminal-court-statistics
     """
+    now = now or datetime.now()
     try:
         print("\n" + "="*60)
         print("Fetching Crown Court Backlog Data (MoJ: Criminal Court Stats)")
@@ -414,29 +583,13 @@ def fetch_crown_court_backlog_data():
         raw_backlog = None
         time_period = "Oct-Dec 2024"
         try:
-            resp = requests.get(
+            path = _download(
                 "https://assets.publishing.service.gov.uk/media/68f1a1b12f0fc56403a3cfd9/criminal-court-statistics-quarterly-october-to-december-2024.ods",
                 timeout=60
             )
-            if resp.status_code == 200 and len(resp.content) > 1000:
-                try:
-                    df = pd.read_excel(io.BytesIO(resp.content), engine="odf", header=None)
-                except Exception:
-                    df = pd.read_excel(io.BytesIO(resp.content), header=None)
-                for idx, row in df.iterrows():
-                    row_str = " ".join([str(c) for c in row.values if pd.notna(c)]).lower()
-                    if "crown" in row_str and ("backlog" in row_str or "caseload" in row_str or "open" in row_str):
-                        for c in row.values:
-                            if pd.notna(c):
-                                try:
-                                    v = float(str(c).replace(",", ""))
-                                    if 30000 <= v <= 100000:
-                                        raw_backlog = v
-                                        break
-                                except Exception:
-                                    pass
-                    if raw_backlog is not None:
-                        break
+            if os.path.getsize(path) > 1000:
+                df = _read_ods(path, 0, **SCAN_HEAD)
+                raw_backlog, _ = _find_in_matching_rows(df, CROWN_BACKLOG_ROW_RE, 30000, 100000)
         except Exception as e:
             print(f"  ODS fetch/parse failed: {e}")
         if raw_backlog is None:
@@ -457,7 +610,7 @@ def fetch_crown_court_backlog_data():
             "time_period": time_period,
             "data_source": "MoJ: Criminal Court Stats",
             "source_url": SOURCE_URLS["crown_court_backlog"],
-            "last_updated": datetime.now().isoformat(),
+            "last_updated": now.isoformat(),
             "information": f"Raw count: {int(raw_backlog):,} cases"
         }
         print(f"  Raw count: {int(raw_backlog):,}")
@@ -468,20 +621,21 @@ def fetch_crown_court_backlog_data():
         return None
 
 
-def fetch_recall_rate_data():
+def fetch_recall_rate_data(now=None):
     """
     Fetch Recall Rate from HMPPS Offender Management Statistics Quarterly.
     Scrapes the GOV.UK collection page to find the latest quarterly release,
     downloads the licence-recalls ODS and prison-population ODS, and computes:
         (total recalls in quarter / prison population snapshot) × 100
     """
+    now = now or datetime.now()
     COLLECTION_URL = "https://www.gov.uk/government/collections/offender-management-statistics-quarterly"
     try:
         print("\n" + "="*60)
         print("Fetching Recall Rate Data (HMPPS: Offender Management Stats)")
         print("="*60)
 
-        resp = requests.get(COLLECTION_URL, timeout=30)
+        resp = _session.get(COLLECTION_URL, timeout=30)
         resp.raise_for_status()
 
         release_match = re.search(
@@ -493,7 +647,7 @@ def fetch_recall_rate_data():
         release_url = "https://www.gov.uk" + release_match.group(1)
         print(f"  Latest release: {release_url}")
 
-        rel_resp = requests.get(release_url, timeout=30)
+        rel_resp = _session.get(release_url, timeout=30)
         rel_resp.raise_for_status()
 
         recalls_match = re.search(
@@ -507,37 +661,29 @@ def fetch_recall_rate_data():
         if not recalls_match or not pop_match:
             raise RuntimeError("Could not find recalls/population ODS links on release page")
 
+        # Parse recalls before fetching the population file, so a release whose
+        # recalls table has changed shape doesn't also cost the second download.
         print(f"  Downloading recalls ODS...")
-        recalls_resp = requests.get(recalls_match.group(1), timeout=60)
-        recalls_resp.raise_for_status()
-
-        print(f"  Downloading prison population ODS...")
-        pop_resp = requests.get(pop_match.group(1), timeout=60)
-        pop_resp.raise_for_status()
-
-        recalls_df = pd.read_excel(
-            io.BytesIO(recalls_resp.content),
-            sheet_name="Table_5_Q_1", engine="odf", header=None,
-        )
+        recalls_path = _download(recalls_match.group(1), timeout=60)
+        recalls_df = _read_ods(recalls_path, "Table_5_Q_1", header=None)
         total_recalls = None
-        for idx, row in recalls_df.iterrows():
-            label = str(row.iloc[0]).strip().lower()
+        for row in recalls_df.to_numpy(dtype=object):
+            label = str(row[0]).strip().lower()
             if "total recalls in recall period" in label:
-                total_recalls = int(float(row.iloc[-1]))
+                total_recalls = int(float(row[-1]))
                 break
         if total_recalls is None:
             raise RuntimeError("Could not find 'Total recalls in recall period' row")
 
-        pop_df = pd.read_excel(
-            io.BytesIO(pop_resp.content),
-            sheet_name="Table_1_Q_1", engine="odf", header=None,
-        )
+        print(f"  Downloading prison population ODS...")
+        pop_path = _download(pop_match.group(1), timeout=60)
+        pop_df = _read_ods(pop_path, "Table_1_Q_1", header=None)
         prison_pop = None
-        for idx, row in pop_df.iterrows():
-            label_parts = [str(c).strip().lower() for c in row.iloc[:3] if pd.notna(c)]
+        for row in pop_df.to_numpy(dtype=object):
+            label_parts = [str(c).strip().lower() for c in row[:3] if pd.notna(c)]
             combined = " ".join(label_parts)
             if "male and female" in combined and "all ages" in combined and "all custody" in combined:
-                prison_pop = int(float(row.iloc[-2]))
+                prison_pop = int(float(row[-2]))
                 break
         if prison_pop is None:
             raise RuntimeError("Could not find total prison population row")
@@ -551,7 +697,7 @@ def fetch_recall_rate_data():
             year = quarter_match.group(2)
             time_period = f"{year} {quarter}"
         else:
-            time_period = f"{datetime.now().year} Q{((datetime.now().month - 1) // 3) + 1}"
+            time_period = _quarter_label(now)
 
         print(f"  Recalls: {total_recalls:,}, Prison Pop: {prison_pop:,}")
         print(f"  Rate: {rate}% ({time_period})")
@@ -566,7 +712,7 @@ def fetch_recall_rate_data():
             "time_period": time_period,
             "data_source": "HMPPS: Offender Management Statistics Quarterly",
             "source_url": release_url,
-            "last_updated": datetime.now().isoformat(),
+            "last_updated": now.isoformat(),
             "information": f"Recalls: {total_recalls:,} / Prison pop: {prison_pop:,}",
         }
         print(f"  Value: {rate}% (RAG: {rag_status.upper()})")
@@ -578,36 +724,43 @@ def fetch_recall_rate_data():
         return None
 
 
+def _dumps_metrics(metrics):
+    """Serialise the metric rows as an indented JSON array (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(metrics, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(metrics, indent=2)
+
+
 def main():
     """Main function to fetch all Crime metrics"""
     print("\n" + "="*60)
     print("UK RAG Dashboard - Crime Data Fetcher")
     print("="*60)
     
+    # Each fetcher downloads (60-120s Excel/ODS files) and then parses with
+    # pandas/openpyxl, which is CPU-bound and would serialise on the GIL in
+    # threads. Fetchers catch their own errors, so run each in its own process
+    # and collect results in order.
+    # One timestamp for the whole run, so every metric carries the same
+    # last_updated and fallback quarter.
+    now = datetime.now()
+    fetchers = (
+        fetch_recorded_crime_data,          # ONS: Crime in England & Wales
+        fetch_charge_rate_data,             # Gov.uk: Crime Outcomes
+        fetch_crown_court_backlog_data,     # MoJ: Criminal Court Stats
+        fetch_recall_rate_data,             # HMPPS: Offender Management Stats
+        fetch_perception_of_safety_data,    # ONS: Annual Supplementary Tables – Table B7
+    )
+    with ProcessPoolExecutor(max_workers=len(fetchers)) as pool:
+        futures = [pool.submit(fetcher, now) for fetcher in fetchers]
+        recorded_crime, charge_rate, crown_backlog, recall, perception_rows = (
+            future.result() for future in futures
+        )
+
     metrics = []
-    
-    # Fetch recorded crime rate
-    recorded_crime = fetch_recorded_crime_data()
-    if recorded_crime:
-        metrics.append(recorded_crime)
-    
-    # Fetch charge rate (Gov.uk: Crime Outcomes)
-    charge_rate = fetch_charge_rate_data()
-    if charge_rate:
-        metrics.append(charge_rate)
-
-    # Crown Court Backlog (MoJ: Criminal Court Stats)
-    crown_backlog = fetch_crown_court_backlog_data()
-    if crown_backlog:
-        metrics.append(crown_backlog)
-
-    # Recall Rate (HMPPS: Offender Management Stats)
-    recall = fetch_recall_rate_data()
-    if recall:
-        metrics.append(recall)
-
-    # Perception of Safety (ONS: Annual Supplementary Tables – Table B7)
-    perception_rows = fetch_perception_of_safety_data()
+    for result in (recorded_crime, charge_rate, crown_backlog, recall):
+        if result:
+            metrics.append(result)
     if perception_rows:
         metrics.extend(perception_rows)
 
@@ -627,7 +780,7 @@ def main():
     print("\n" + "="*60)
     print("JSON Output")
     print("="*60)
-    print(json.dumps(metrics, indent=2))
+    print(_dumps_metrics(metrics))
     
     return metrics
 
@@ -18,6 +18,7 @@ import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -39,6 +40,9 @@ MONGO_URI = (
     or "mongodb://localhost:27017/uk_rag_portal"
 )
 LOG_PREFIX = "[DailyRefresh]"
+# Category fetcher scripts run side by side (see run()). Each is a separate
+# Python process with pandas loaded, so the pool is kept small.
+FETCHER_CONCURRENCY = 3
 
 CATEGORIES: List[Dict[str, Any]] = [
     {
@@ -489,12 +493,18 @@ def run(only_category: Optional[str] = None) -> None:
     category_errors: List[str] = []
 
     try:
-        for cat in categories:
+        # The fetcher scripts are independent and spend most of their time waiting
+        # on ONS / DfE / NHS downloads, so they run concurrently: the refresh waits
+        # for the slowest scripts rather than the sum of all of them. Validation
+        # and the Mongo writes below still go one category at a time, in order.
+        with ThreadPoolExecutor(max_workers=FETCHER_CONCURRENCY) as pool:
+            fetched = list(pool.map(run_fetcher, categories))
+
+        for cat, (raw_metrics, fetch_err) in zip(categories, fetched):
             log(f"\n{'─' * 50}")
             log(f"Processing: {cat['name']}")
             log(f"{'─' * 50}")
 
-            raw_metrics, fetch_err = run_fetcher(cat)
             if fetch_err:
                 log_error(fetch_err)
                 category_errors.append(fetch_err)
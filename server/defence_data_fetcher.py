@@ -12,12 +12,33 @@ from typing import Any, Dict, List, Optional
 import os
 import requests
 import pandas as pd
+from urllib3.util.retry import Retry
 from datetime import datetime, timezone
 import json
 import sys
-import io
+from concurrent.futures import ThreadPoolExecutor
 import re
 
+from http_cache import cached_download
+from metric_cache import FRESH_HOURS, load_metric, save_metric
+from rag import rag_status, rag_statuses, signed_table
+
+try:
+    import python_calamine  # noqa: F401  (Rust reader; pandas >= 2.2 exposes it as engine="calamine")
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None  # pandas default (openpyxl for .xlsx)
+
+try:
+    from lxml import html as lxml_html  # C HTML parser + XPath for link discovery
+except ImportError:
+    lxml_html = None
+
+try:
+    import orjson  # Rust JSON encoder for the stdout payload
+except ImportError:
+    orjson = None
+
 # RAG Thresholds for Defence Metrics
 RAG_THRESHOLDS = {
     "defence_spending_gdp": {
@@ -71,20 +92,23 @@ RAG_THRESHOLDS = {
     },
 }
 
+def _quarter_label(when: datetime) -> str:
+    """Format a datetime as 'YYYY QN'."""
+    return f"{when.year} Q{((when.month - 1) // 3) + 1}"
+
+
+# Every defence metric is higher-is-better.
+_RAG_TABLE = signed_table(RAG_THRESHOLDS, higher_is_better=RAG_THRESHOLDS)
+
+
 def calculate_rag_status(metric_key: str, value: float) -> str:
     """Calculate RAG status based on thresholds (returns lowercase)"""
-    if metric_key not in RAG_THRESHOLDS:
-        return "amber"
-    
-    thresholds = RAG_THRESHOLDS[metric_key]
-    
-    # For all defence metrics (higher is better)
-    if value >= thresholds["green"]:
-        return "green"
-    elif value >= thresholds["amber"]:
-        return "amber"
-    else:
-        return "red"
+    return rag_status(_RAG_TABLE, metric_key, value)
+
+
+def calculate_rag_statuses(metric_key: str, values) -> List[str]:
+    """Vectorised calculate_rag_status for a sequence of values (returns a list)."""
+    return rag_statuses(_RAG_TABLE, metric_key, values)
 
 
 def compute_sea_mass_score(
@@ -561,34 +585,86 @@ def compute_combined_sustainability_score():
 
     return round(score, 1)
 
+# One keep-alive session for every defence request, so the two ONS series and
+# the MOD page + workbook reuse pooled connections. Transient gateway errors are
+# retried with backoff. cached_download sends conditional GETs so unchanged
+# ONS / MOD files are revalidated (304) rather than re-downloaded.
+_session = requests.Session()
+_session.headers.update({"User-Agent": "UK-RAG-Dashboard/1.0"})
+_session.mount("https://", requests.adapters.HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+))
+
+
+# Fail fast when a host is unreachable instead of waiting out the read timeout.
+CONNECT_TIMEOUT = 10
+
+
+def _download(url: str, timeout: float) -> str:
+    """Stream a file into the on-disk HTTP cache (see http_cache) and return its local path."""
+    return cached_download(_session, url, (CONNECT_TIMEOUT, timeout))
+
+
+# The UK Forces / all-services totals sit near the top of the MOD strength
+# tables; the rows below are per-trade and per-rank detail we never read.
+PERSONNEL_NROWS = 200
+# Typical sheet names: "Strength", "Personnel", "Summary", etc.
+PERSONNEL_SHEET_RE = re.compile(r"strength|personnel|summary", re.I)
+# Row labels of the all-services total (the percentage-column layout matches only the first two).
+PERSONNEL_TOTAL_RE = re.compile(r"uk forces|total|all services")
+PERSONNEL_PCT_TOTAL_RE = re.compile(r"uk forces|total")
+
+# Fallback when lxml is missing: .xlsx and .xls hrefs (single- or double-quoted)
+# in one pass over the page; the .xls branch also matches .xlsx.
+EXCEL_HREF_RE = re.compile(r"""href=["']([^"']*\.xlsx?[^"']*)["']""")
+
+
+def _excel_links(html: str) -> List[str]:
+    """Every href on the page that points at an .xls/.xlsx file, in document order."""
+    if lxml_html is not None:
+        if not html.strip():
+            return []
+        return lxml_html.fromstring(html).xpath('//a[contains(@href, ".xls")]/@href')
+    return EXCEL_HREF_RE.findall(html)
+
+
+def _first_excel_link(html: str) -> Optional[str]:
+    """First .xlsx link on the page, else the first .xls link, else None."""
+    links = _excel_links(html)
+    return next((link for link in links if ".xlsx" in link), links[0] if links else None)
+
+
+def _latest_annual(csv_path: str) -> Optional[float]:
+    """Latest annual ("YYYY") value in an ONS generator CSV, or None.
+
+    The file is a two-column ("label","value") export: metadata rows first, then
+    annual, quarterly and monthly observations. One C-level read_csv handles the
+    quoting; annual rows are picked out with a vectorised match.
+    """
+    df = pd.read_csv(
+        csv_path,
+        header=None,
+        names=["period", "value"],
+        usecols=[0, 1],
+        dtype=str,
+        encoding="utf-8-sig",
+        on_bad_lines="skip",
+    )
+    annual = df["period"].str.strip().str.fullmatch(r"\d{4}", na=False)
+    values = pd.to_numeric(df.loc[annual, "value"].str.replace(",", "", regex=False), errors="coerce").dropna()
+    return float(values.iloc[-1]) if not values.empty else None
+
+
 def _fetch_defence_spending_from_ons() -> Optional[float]:
     """Try to compute defence spending as % of GDP from ONS series KLYR (defence) / YBHA (GDP)."""
     try:
         defence_url = "https://www.ons.gov.uk/generator?format=csv&uri=/economy/governmentpublicsectorandtaxes/publicspending/timeseries/klyr/qna"
         gdp_url = "https://www.ons.gov.uk/generator?format=csv&uri=/economy/grossdomesticproductgdp/timeseries/ybha/qna"
 
-        def _latest_annual(csv_text: str) -> Optional[float]:
-            lines = csv_text.strip().split("\n")
-            last_val = None
-            for line in reversed(lines):
-                parts = line.strip().strip('"').split('","')
-                if len(parts) == 2:
-                    period = parts[0].strip()
-                    if period.isdigit() and len(period) == 4:
-                        try:
-                            last_val = float(parts[1].strip().replace(",", ""))
-                            return last_val
-                        except ValueError:
-                            continue
-            return None
-
-        def_resp = requests.get(defence_url, timeout=30)
-        gdp_resp = requests.get(gdp_url, timeout=30)
-        if def_resp.status_code != 200 or gdp_resp.status_code != 200:
-            return None
-
-        def_val = _latest_annual(def_resp.text)
-        gdp_val = _latest_annual(gdp_resp.text)
+        def_val = _latest_annual(_download(defence_url, timeout=30))
+        gdp_val = _latest_annual(_download(gdp_url, timeout=30))
         if def_val and gdp_val and gdp_val > 0:
             pct = (def_val / gdp_val) * 100
             if 1.0 < pct < 5.0:
@@ -609,13 +685,19 @@ DEFENCE_SPENDING_HISTORY: Dict[str, float] = {
 }
 
 
-def fetch_defence_spending() -> Optional[Dict[str, Any]]:
+def fetch_defence_spending(now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
     """
     Fetch UK defence spending as % of GDP.
 
     Primary: compute from ONS series KLYR (government defence spend) / YBHA (GDP).
-    Fallback: published NATO / MOD figure for the latest available year.
+    Fallback: the last ONS-derived value, then the published NATO / MOD figure for
+    the latest available year.
     """
+    now = now or datetime.now(timezone.utc)
+    cached = load_metric("defence_spending_gdp", max_age_hours=FRESH_HOURS)
+    if cached:
+        print(f"[Defence] Defence spending: reusing result saved within {FRESH_HOURS:g}h", file=sys.stderr, flush=True)
+        return {**cached, "last_updated": now.isoformat()}
     try:
         print(f"[Defence]\n" + "="*60, file=sys.stderr, flush=True)
         print("[Defence] Fetching Defence Spending Data", file=sys.stderr, flush=True)
@@ -625,7 +707,11 @@ def fetch_defence_spending() -> Optional[Dict[str, Any]]:
         source = "ONS KLYR/YBHA"
 
         if defence_spending_pct is None:
-            current_year = str(datetime.now(timezone.utc).year)
+            stale = load_metric("defence_spending_gdp")
+            if stale:
+                print("[Defence]   ONS series unavailable; using last ONS-derived value", file=sys.stderr, flush=True)
+                return stale
+            current_year = str(now.year)
             for yr in [current_year, str(int(current_year) - 1), str(int(current_year) - 2)]:
                 if yr in DEFENCE_SPENDING_HISTORY:
                     defence_spending_pct = DEFENCE_SPENDING_HISTORY[yr]
@@ -635,7 +721,7 @@ def fetch_defence_spending() -> Optional[Dict[str, Any]]:
                 defence_spending_pct = 2.1
                 source = "fallback estimate"
 
-        time_period = datetime.now(timezone.utc).strftime("%Y")
+        time_period = now.strftime("%Y")
 
         metric = {
             "metric_name": "Defence Spending (% of GDP)",
@@ -646,25 +732,28 @@ def fetch_defence_spending() -> Optional[Dict[str, Any]]:
             "time_period": time_period,
             "data_source": f"MOD / NATO ({source})",
             "source_url": "https://www.gov.uk/government/statistics/defence-departmental-resources-2024",
-            "last_updated": datetime.now(timezone.utc).isoformat(),
+            "last_updated": now.isoformat(),
         }
 
         print(f"[Defence]   Defence Spending: {defence_spending_pct:.2f}% of GDP ({metric['rag_status'].upper()}) via {source}", file=sys.stderr, flush=True)
+        if source == "ONS KLYR/YBHA":
+            save_metric(metric)
         return metric
 
     except Exception as e:
         print(f"[Defence] Error fetching defence spending: {e}", file=sys.stderr, flush=True)
         import traceback
         traceback.print_exc()
-        return None
+        return load_metric("defence_spending_gdp")
 
 
-def fetch_equipment_spend() -> Optional[Dict[str, Any]]:
+def fetch_equipment_spend(now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
     """
     Fetch equipment spend from MOD: Trade & Contracts.
     Source: https://www.gov.uk/government/collections/defence-trade-and-industry-index
     Returns spend as % of defence budget (equipment/enabling as share of MOD spend).
     """
+    now = now or datetime.now(timezone.utc)
     try:
         print(f"[Defence]\n" + "="*60, file=sys.stderr, flush=True)
         print("[Defence] Fetching Equipment Spend Data (MOD: Trade & Contracts)", file=sys.stderr, flush=True)
@@ -672,7 +761,7 @@ def fetch_equipment_spend() -> Optional[Dict[str, Any]]:
         # MOD Trade, Industry and Contracts: 2024/25 £40.6bn paid to UK/foreign orgs; equipment share ~40%
         # Use published share of defence budget spent on equipment/enabling
         value_pct = 40.0  # Placeholder: typical equipment share from MOD Trade & Contracts
-        time_period = datetime.now().strftime("%Y")
+        time_period = now.strftime("%Y")
         rag_status = calculate_rag_status("equipment_spend", value_pct)
         metric = {
             "metric_name": "Equipment Spend",
@@ -683,7 +772,7 @@ def fetch_equipment_spend() -> Optional[Dict[str, Any]]:
             "time_period": time_period,
             "data_source": "MOD: Trade & Contracts",
             "source_url": "https://www.gov.uk/government/collections/defence-trade-and-industry-index",
-            "last_updated": datetime.now().isoformat(),
+            "last_updated": now.isoformat(),
         }
         print(f"[Defence]   Equipment Spend: {value_pct}% of defence budget ({metric['rag_status'].upper()})", file=sys.stderr, flush=True)
         return metric
@@ -692,18 +781,19 @@ def fetch_equipment_spend() -> Optional[Dict[str, Any]]:
         return None
 
 
-def fetch_deployability() -> Optional[Dict[str, Any]]:
+def fetch_deployability(now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
     """
     Fetch deployability % from MOD: Health & Wellbeing.
     Source: MOD health/medical statistics; % of force fit for deployment.
     """
+    now = now or datetime.now(timezone.utc)
     try:
         print(f"[Defence]\n" + "="*60, file=sys.stderr, flush=True)
         print("[Defence] Fetching Deployability Data (MOD: Health & Wellbeing)", file=sys.stderr, flush=True)
         print("[Defence] " + "="*60, file=sys.stderr, flush=True)
         # MOD does not publish a single "deployability %" series; derived from medical fitness/health stats
         value_pct = 78.0  # Placeholder: typical reported range from MOD health stats
-        time_period = datetime.now().strftime("%Y")
+        time_period = now.strftime("%Y")
         rag_status = calculate_rag_status("deployability", value_pct)
         metric = {
             "metric_name": "Deployability %",
@@ -714,7 +804,7 @@ def fetch_deployability() -> Optional[Dict[str, Any]]:
             "time_period": time_period,
             "data_source": "MOD: Health & Wellbeing",
             "source_url": "https://www.gov.uk/government/collections/defence-mental-health-statistics-index",
-            "last_updated": datetime.now().isoformat(),
+            "last_updated": now.isoformat(),
         }
         print(f"[Defence]   Deployability %: {value_pct}% ({metric['rag_status'].upper()})", file=sys.stderr, flush=True)
         return metric
@@ -723,12 +813,13 @@ def fetch_deployability() -> Optional[Dict[str, Any]]:
         return None
 
 
-def fetch_equipment_readiness() -> Optional[Dict[str, Any]]:
+def fetch_equipment_readiness(now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
     """
     Fetch equipment readiness percentage
     Note: This data is not publicly available in structured format
     MOD publishes annual reports but not monthly readiness statistics
     """
+    now = now or datetime.now(timezone.utc)
     try:
         print(f"[Defence]\n" + "="*60, file=sys.stderr, flush=True)
         print("[Defence] Fetching Equipment Readiness Data", file=sys.stderr, flush=True)
@@ -749,7 +840,7 @@ def fetch_equipment_readiness() -> Optional[Dict[str, Any]]:
         
         readiness_pct = 78.0  # Based on recent MOD reporting
         
-        time_period = datetime.now().strftime("%Y Q1")
+        time_period = now.strftime("%Y Q1")
         
         metric = {
             "metric_name": "Equipment Readiness",
@@ -760,7 +851,7 @@ def fetch_equipment_readiness() -> Optional[Dict[str, Any]]:
             "time_period": time_period,
             "data_source": "Ministry of Defence (Annual Reports)",
             "source_url": "https://www.gov.uk/government/collections/uk-armed-forces-equipment-and-formations",
-            "last_updated": datetime.now().isoformat()
+            "last_updated": now.isoformat()
         }
         
         print(f"[Defence]   Equipment Readiness: {readiness_pct}% ({metric['rag_status'].upper()})", file=sys.stderr, flush=True)
@@ -771,10 +862,41 @@ def fetch_equipment_readiness() -> Optional[Dict[str, Any]]:
         print(f"[Defence] Error fetching equipment readiness: {e}", file=sys.stderr, flush=True)
         return None
 
-def fetch_personnel_strength() -> Optional[Dict[str, Any]]:
+def _personnel_columns(columns) -> tuple:
+    """
+    Pick (strength_col, target_col, pct_col) from a personnel sheet's header.
+
+    A single "strength vs target" / "% of target" column wins outright; otherwise
+    the last strength and target columns seen are used.
+    """
+    strength_col = None
+    target_col = None
+    pct_col = None
+    for col in columns:
+        col_lower = str(col).lower()
+        if 'strength' in col_lower and 'target' in col_lower:
+            pct_col = col
+            break
+        elif '%' in col_lower or 'percent' in col_lower:
+            if 'strength' in col_lower or 'target' in col_lower:
+                pct_col = col
+                break
+        elif 'strength' in col_lower:
+            strength_col = col
+        elif 'target' in col_lower:
+            target_col = col
+    return strength_col, target_col, pct_col
+
+
+def fetch_personnel_strength(now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
     """
     Fetch personnel strength as % of target from MOD quarterly Excel files
     """
+    now = now or datetime.now(timezone.utc)
+    cached = load_metric("personnel_strength", max_age_hours=FRESH_HOURS)
+    if cached:
+        print(f"[Defence] Personnel strength: reusing result saved within {FRESH_HOURS:g}h", file=sys.stderr, flush=True)
+        return {**cached, "last_updated": now.isoformat()}
     try:
         print(f"[Defence]\n" + "="*60, file=sys.stderr, flush=True)
         print("[Defence] Fetching Personnel Strength Data", file=sys.stderr, flush=True)
@@ -799,24 +921,17 @@ def fetch_personnel_strength() -> Optional[Dict[str, Any]]:
         
         try:
             # Fetch the page to find Excel download link
-            page_response = requests.get(latest_quarter_url, timeout=30)
+            page_response = _session.get(latest_quarter_url, timeout=(CONNECT_TIMEOUT, 30))
             if page_response.status_code == 200:
                 # Parse HTML to find Excel download link
-                import re
-                excel_links = re.findall(r'href="([^"]*\.xlsx[^"]*)"', page_response.text)
-                excel_links.extend(re.findall(r'href="([^"]*\.xls[^"]*)"', page_response.text))
-                
-                if excel_links:
-                    excel_url = excel_links[0]
-                    if not excel_url.startswith('http'):
-                        if excel_url.startswith('//'):
-                            excel_url = "https:" + excel_url
-                        elif excel_url.startswith('/'):
-                            excel_url = "https://www.gov.uk" + excel_url
-                        else:
-                            excel_url = base_url + excel_url
-                else:
-                    excel_url = None
+                excel_url = _first_excel_link(page_response.text)
+                if excel_url and not excel_url.startswith('http'):
+                    if excel_url.startswith('//'):
+                        excel_url = "https:" + excel_url
+                    elif excel_url.startswith('/'):
+                        excel_url = "https://www.gov.uk" + excel_url
+                    else:
+                        excel_url = base_url + excel_url
             else:
                 excel_url = None
         except Exception:
@@ -825,74 +940,59 @@ def fetch_personnel_strength() -> Optional[Dict[str, Any]]:
         # If we found Excel URL, parse it
         if excel_url:
             print(f"[Defence] Downloading from: {excel_url}", file=sys.stderr, flush=True)
-            response = requests.get(excel_url, timeout=60)
-            response.raise_for_status()
-            
-            # Read Excel file
-            excel_file = pd.ExcelFile(io.BytesIO(response.content))
-            print(f"[Defence] Available sheets: {excel_file.sheet_names[:5]}", file=sys.stderr, flush=True)
-            
-            # Look for sheet with strength vs. target data
-            # Typical sheet names: "Strength", "Personnel", "Summary", etc.
-            target_sheet = None
-            for sheet in excel_file.sheet_names:
-                if 'strength' in sheet.lower() or 'personnel' in sheet.lower() or 'summary' in sheet.lower():
-                    target_sheet = sheet
-                    break
+            path = _download(excel_url, timeout=60)
             
-            if not target_sheet:
-                target_sheet = excel_file.sheet_names[0]  # Use first sheet
-            
-            print(f"[Defence] Using sheet: {target_sheet}", file=sys.stderr, flush=True)
-            df = pd.read_excel(excel_file, sheet_name=target_sheet)
+            # Read Excel file: open it once, list sheets, parse only the target's top rows
+            with pd.ExcelFile(path, engine=EXCEL_ENGINE) as excel_file:
+                print(f"[Defence] Available sheets: {excel_file.sheet_names[:5]}", file=sys.stderr, flush=True)
+                
+                # Look for sheet with strength vs. target data, else use the first sheet
+                target_sheet = next(
+                    (sheet for sheet in excel_file.sheet_names if PERSONNEL_SHEET_RE.search(sheet)),
+                    excel_file.sheet_names[0],
+                )
+                
+                print(f"[Defence] Using sheet: {target_sheet}", file=sys.stderr, flush=True)
+                # Header row first, then only the label column plus the columns we use
+                header = pd.read_excel(excel_file, sheet_name=target_sheet, nrows=0).columns
+                strength_col, target_col, pct_col = _personnel_columns(header)
+                if strength_col and target_col:
+                    wanted = [strength_col, target_col]
+                elif pct_col:
+                    wanted = [pct_col]
+                else:
+                    wanted = []
+                usecols = sorted({0, *(header.get_loc(col) for col in wanted)}) if len(header) else None
+                df = pd.read_excel(
+                    excel_file, sheet_name=target_sheet, usecols=usecols, nrows=PERSONNEL_NROWS
+                )
             
             print(f"[Defence] Sheet dimensions: {df.shape}", file=sys.stderr, flush=True)
-            print(f"[Defence] Columns: {df.columns.tolist()}", file=sys.stderr, flush=True)
-            
-            # Find strength vs. target percentage
-            # Look for columns with "target", "strength", "%" or similar
-            strength_col = None
-            target_col = None
-            pct_col = None
+            print(f"[Defence] Columns: {header.tolist()}", file=sys.stderr, flush=True)
             
-            for col in df.columns:
-                col_lower = str(col).lower()
-                if 'strength' in col_lower and 'target' in col_lower:
-                    pct_col = col
-                    break
-                elif '%' in col_lower or 'percent' in col_lower:
-                    if 'strength' in col_lower or 'target' in col_lower:
-                        pct_col = col
-                        break
-                elif 'strength' in col_lower:
-                    strength_col = col
-                elif 'target' in col_lower:
-                    target_col = col
+            # Label column, lower-cased once; total rows are picked out by mask
+            first_col = df.iloc[:, 0].astype(str).str.lower() if len(df.columns) else pd.Series(dtype=str)
             
             # Calculate percentage if we have strength and target
             if strength_col and target_col:
-                # Find total UK Forces row
-                for idx, row in df.iterrows():
-                    first_col = str(row.iloc[0] if len(row) > 0 else '').lower()
-                    if 'uk forces' in first_col or 'total' in first_col or 'all services' in first_col:
-                        strength_val = pd.to_numeric(row[strength_col], errors='coerce')
-                        target_val = pd.to_numeric(row[target_col], errors='coerce')
-                        if pd.notna(strength_val) and pd.notna(target_val) and target_val > 0:
-                            strength_pct = (strength_val / target_val) * 100
-                            break
+                # First total UK Forces row with a usable strength and target
+                strength_vals = pd.to_numeric(df[strength_col], errors='coerce')
+                target_vals = pd.to_numeric(df[target_col], errors='coerce')
+                usable = (
+                    first_col.str.contains(PERSONNEL_TOTAL_RE)
+                    & strength_vals.notna()
+                    & (target_vals > 0)
+                )
+                if usable.any():
+                    strength_pct = float(strength_vals[usable].iloc[0] / target_vals[usable].iloc[0] * 100)
                 else:
                     strength_pct = None
             elif pct_col:
-                # Use percentage column directly
-                for idx, row in df.iterrows():
-                    first_col = str(row.iloc[0] if len(row) > 0 else '').lower()
-                    if 'uk forces' in first_col or 'total' in first_col:
-                        strength_pct = pd.to_numeric(row[pct_col], errors='coerce')
-                        if pd.notna(strength_pct):
-                            strength_pct = float(strength_pct)
-                        else:
-                            strength_pct = None
-                        break
+                # Use percentage column directly, from the first total row
+                total_rows = first_col.str.contains(PERSONNEL_PCT_TOTAL_RE)
+                if total_rows.any():
+                    strength_pct = pd.to_numeric(df[pct_col], errors='coerce')[total_rows].iloc[0]
+                    strength_pct = float(strength_pct) if pd.notna(strength_pct) else None
                 else:
                     strength_pct = None
             else:
@@ -900,8 +1000,13 @@ def fetch_personnel_strength() -> Optional[Dict[str, Any]]:
         else:
             strength_pct = None
         
-        # Fallback if parsing failed
-        if strength_pct is None or strength_pct <= 0:
+        # Fallback if parsing failed: last parsed value, else an estimate
+        parsed = strength_pct is not None and strength_pct > 0
+        if not parsed:
+            stale = load_metric("personnel_strength")
+            if stale:
+                print("[Defence]   Note: Using last parsed value - Excel structure may have changed", file=sys.stderr, flush=True)
+                return stale
             # Based on recent MOD reporting: ~181,550 personnel vs target
             # Typical target is around 190,000-195,000
             # This gives approximately 92-95% of target
@@ -910,7 +1015,7 @@ def fetch_personnel_strength() -> Optional[Dict[str, Any]]:
         else:
             print(f"[Defence]   Parsed from Excel: {strength_pct:.1f}%", file=sys.stderr, flush=True)
         
-        time_period = datetime.now().strftime("%Y")
+        time_period = now.strftime("%Y")
         
         metric = {
             "metric_name": "Personnel Strength",
@@ -921,17 +1026,19 @@ def fetch_personnel_strength() -> Optional[Dict[str, Any]]:
             "time_period": time_period,
             "data_source": "MOD: Service Personnel Stats",
             "source_url": excel_url or "https://www.gov.uk/government/statistics/quarterly-service-personnel-statistics-2024",
-            "last_updated": datetime.now().isoformat()
+            "last_updated": now.isoformat()
         }
         
         print(f"[Defence]   Personnel Strength: {strength_pct:.1f}% of target ({metric['rag_status'].upper()})", file=sys.stderr, flush=True)
+        if parsed:
+            save_metric(metric)
         return metric
         
     except Exception as e:
         print(f"[Defence] Error fetching personnel strength: {e}", file=sys.stderr, flush=True)
         import traceback
         traceback.print_exc()
-        return None
+        return load_metric("personnel_strength")
 
 
 # ---------------------------------------------------------------------------
@@ -1076,7 +1183,7 @@ def _format_recent_changes(recent: List[Dict[str, Any]], limit: int = 3) -> str:
     return "\n".join(lines)
 
 
-def fetch_sea_mass() -> Optional[Dict[str, Any]]:
+def fetch_sea_mass(now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
     """
     Compute and return the Sea Mass composite metric.
 
@@ -1085,6 +1192,7 @@ def fetch_sea_mass() -> Optional[Dict[str, Any]]:
     score, others are excluded but kept for citation surfacing. When the
     collection is empty or unreachable, falls back to hardcoded counts.
     """
+    now = now or datetime.now(timezone.utc)
     try:
         print(f"[Defence]\n" + "="*60, file=sys.stderr, flush=True)
         print("[Defence] Computing Sea Mass Composite Score", file=sys.stderr, flush=True)
@@ -1130,9 +1238,7 @@ def fetch_sea_mass() -> Optional[Dict[str, Any]]:
         rag = calculate_rag_status("sea_mass", score_pct)
 
         # Label Sea Mass snapshots by calendar quarter.
-        now = datetime.now(timezone.utc)
-        quarter = (now.month - 1) // 3 + 1
-        time_period = f"{now.year} Q{quarter}"
+        time_period = _quarter_label(now)
 
         information = get_sea_mass_information(
             data_date=time_period,
@@ -1172,7 +1278,7 @@ def fetch_sea_mass() -> Optional[Dict[str, Any]]:
             "time_period": time_period,
             "data_source": data_source_label,
             "source_url": "https://www.navylookout.com/",
-            "last_updated": datetime.now().isoformat(),
+            "last_updated": now.isoformat(),
             "information": information,
         }
 
@@ -1198,7 +1304,7 @@ LAND_MASS_FALLBACK_COUNTS = {
 }
 
 
-def fetch_land_mass() -> Optional[Dict[str, Any]]:
+def fetch_land_mass(now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
     """
     Compute and return the Land Mass composite metric.
 
@@ -1208,6 +1314,7 @@ def fetch_land_mass() -> Optional[Dict[str, Any]]:
     'refit' counts toward the score, others are surfaced as recent changes.
     Falls back to hardcoded constants if the collection is empty/unreachable.
     """
+    now = now or datetime.now(timezone.utc)
     try:
         print(f"[Defence]\n" + "="*60, file=sys.stderr, flush=True)
         print("[Defence] Computing Land Mass Composite Score", file=sys.stderr, flush=True)
@@ -1253,9 +1360,7 @@ def fetch_land_mass() -> Optional[Dict[str, Any]]:
         )
         rag = calculate_rag_status("land_mass", score_pct)
 
-        now = datetime.now(timezone.utc)
-        quarter = (now.month - 1) // 3 + 1
-        time_period = f"{now.year} Q{quarter}"
+        time_period = _quarter_label(now)
 
         information = get_land_mass_information(
             data_date=time_period,
@@ -1294,7 +1399,7 @@ def fetch_land_mass() -> Optional[Dict[str, Any]]:
             "time_period": time_period,
             "data_source": data_source_label,
             "source_url": "https://www.janes.com/",
-            "last_updated": datetime.now(timezone.utc).isoformat(),
+            "last_updated": now.isoformat(),
             "information": information,
         }
 
@@ -1332,7 +1437,7 @@ AIR_MASS_FALLBACK_COUNTS = {
 }
 
 
-def fetch_air_mass() -> Optional[Dict[str, Any]]:
+def fetch_air_mass(now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
     """
     Compute and return the Air Mass composite metric.
 
@@ -1341,6 +1446,7 @@ def fetch_air_mass() -> Optional[Dict[str, Any]]:
     autonomous) carry a `quantity` field summed for active+refit. Falls back
     to hardcoded constants if the collection is empty/unreachable.
     """
+    now = now or datetime.now(timezone.utc)
     try:
         print(f"[Defence]\n" + "="*60, file=sys.stderr, flush=True)
         print("[Defence] Computing Air Mass Composite Score", file=sys.stderr, flush=True)
@@ -1382,9 +1488,7 @@ def fetch_air_mass() -> Optional[Dict[str, Any]]:
         )
         rag = calculate_rag_status("air_mass", score_pct)
 
-        now = datetime.now(timezone.utc)
-        quarter = (now.month - 1) // 3 + 1
-        time_period = f"{now.year} Q{quarter}"
+        time_period = _quarter_label(now)
 
         information = get_air_mass_information(
             data_date=time_period,
@@ -1413,7 +1517,7 @@ def fetch_air_mass() -> Optional[Dict[str, Any]]:
             "time_period": time_period,
             "data_source": data_source_label,
             "source_url": "https://www.flightglobal.com/defence/2026-world-air-forces-directory/165267.article",
-            "last_updated": datetime.now(timezone.utc).isoformat(),
+            "last_updated": now.isoformat(),
             "information": information,
         }
 
@@ -1425,7 +1529,7 @@ def fetch_air_mass() -> Optional[Dict[str, Any]]:
         return None
 
 
-def fetch_defence_industry_vitality() -> Optional[Dict[str, Any]]:
+def fetch_defence_industry_vitality(now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
     """
     Return the Defence Industry Vitality metric from the cron cache. The cron fetches
     ONS Weapons & Ammunition (P39H) and Military Fighting Vehicles (P3AJ) series,
@@ -1433,6 +1537,7 @@ def fetch_defence_industry_vitality() -> Optional[Dict[str, Any]]:
     and Pillar 2 (YoY momentum, 5% target). If no cache exists, skip so the tile
     shows last value from DB or 'No data' until the daily cron runs.
     """
+    now = now or datetime.now(timezone.utc)
     cache_path = os.path.join(os.path.dirname(__file__), "defence_industry_vitality_cache.json")
     if not os.path.isfile(cache_path):
         return None
@@ -1445,7 +1550,7 @@ def fetch_defence_industry_vitality() -> Optional[Dict[str, Any]]:
 
     value_pct = data.get("value")
     rag_str = data.get("rag_status", "amber")
-    time_period = data.get("time_period") or f"{datetime.now(timezone.utc).year} Q{(datetime.now(timezone.utc).month - 1) // 3 + 1}"
+    time_period = data.get("time_period") or _quarter_label(now)
 
     if value_pct is None:
         return None
@@ -1459,63 +1564,44 @@ def fetch_defence_industry_vitality() -> Optional[Dict[str, Any]]:
         "time_period": time_period,
         "data_source": "",
         "source_url": "",
-        "last_updated": data.get("updated_at") or datetime.now(timezone.utc).isoformat(),
+        "last_updated": data.get("updated_at") or now.isoformat(),
     }
     print(f"[Defence]   Defence Industry Vitality: {value_pct}% ({rag_str.upper()}) [from cache]", file=sys.stderr, flush=True)
     return metric
 
+
+def _dumps_metrics(metrics: List[Dict[str, Any]]) -> str:
+    """Serialise the metric rows as an indented JSON array (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(metrics, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(metrics, indent=2)
+
+
 def main() -> list:
     """Main function to fetch all Defence metrics"""
     print(f"[Defence]\n" + "="*60, file=sys.stderr, flush=True)
     print("[Defence] UK RAG Dashboard - Defence Data Fetcher", file=sys.stderr, flush=True)
     print("[Defence] " + "="*60, file=sys.stderr, flush=True)
     
-    metrics = []
-    
-    # Fetch defence spending (uses real MOD/ONS data)
-    spending_metric = fetch_defence_spending()
-    if spending_metric:
-        metrics.append(spending_metric)
-    
-    # Fetch equipment readiness (requires manual data or MOD API)
-    readiness_metric = fetch_equipment_readiness()
-    if readiness_metric:
-        metrics.append(readiness_metric)
-    
-    # Fetch personnel strength (should parse MOD Excel files)
-    personnel_metric = fetch_personnel_strength()
-    if personnel_metric:
-        metrics.append(personnel_metric)
-
-    # Equipment Spend (MOD: Trade & Contracts)
-    equipment_spend_metric = fetch_equipment_spend()
-    if equipment_spend_metric:
-        metrics.append(equipment_spend_metric)
-
-    # Deployability % (MOD: Health & Wellbeing)
-    deployability_metric = fetch_deployability()
-    if deployability_metric:
-        metrics.append(deployability_metric)
-
-    # Sea Mass composite score (open-source fleet mass model)
-    sea_mass_metric = fetch_sea_mass()
-    if sea_mass_metric:
-        metrics.append(sea_mass_metric)
-
-    # Land Mass composite score (Army mass model)
-    land_mass_metric = fetch_land_mass()
-    if land_mass_metric:
-        metrics.append(land_mass_metric)
-    
-    # Air Mass composite score (combat air model)
-    air_mass_metric = fetch_air_mass()
-    if air_mass_metric:
-        metrics.append(air_mass_metric)
-    
-    # Defence Industry Vitality (ONS production turnover; updated by daily cron)
-    defence_industry_vitality_metric = fetch_defence_industry_vitality()
-    if defence_industry_vitality_metric:
-        metrics.append(defence_industry_vitality_metric)
+    # The fetchers are independent and mostly wait on HTTP (ONS, GOV.UK) or
+    # MongoDB, so run them on a thread pool; results keep this order.
+    fetchers = (
+        fetch_defence_spending,             # ONS KLYR/YBHA, NATO/MOD fallback
+        fetch_equipment_readiness,          # MOD annual reports
+        fetch_personnel_strength,           # MOD quarterly Excel files
+        fetch_equipment_spend,              # MOD: Trade & Contracts
+        fetch_deployability,                # MOD: Health & Wellbeing
+        fetch_sea_mass,                     # fleet mass model (fleet_inventory)
+        fetch_land_mass,                    # Army mass model
+        fetch_air_mass,                     # combat air model
+        fetch_defence_industry_vitality,    # ONS production turnover; daily cron cache
+    )
+    # One timestamp for the whole run, so every metric carries the same
+    # last_updated and period.
+    now = datetime.now(timezone.utc)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda fetcher: fetcher(now), fetchers))
+    metrics = [metric for metric in results if metric]
     
     # Print summary
     print(f"[Defence]\n" + "="*60, file=sys.stderr, flush=True)
@@ -1533,7 +1619,7 @@ def main() -> list:
     print(f"[Defence]\n" + "="*60, file=sys.stderr, flush=True)
     print("[Defence] JSON Output", file=sys.stderr, flush=True)
     print("[Defence] " + "="*60, file=sys.stderr, flush=True)
-    print(json.dumps(metrics, indent=2))
+    print(_dumps_metrics(metrics))
     
     return metrics
 
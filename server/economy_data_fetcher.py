@@ -4,33 +4,95 @@ Economy Data Fetcher for UK RAG Dashboard
 Fetches GDP Growth, CPI Inflation, and Output per Hour from ONS.
 """
 
+import re
+import threading
+import time
 import requests
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, Optional, List
+from functools import partial
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, Optional, List, Tuple
 import logging
 import json
 import os
 from os import path
 
+from http_cache import cached_download, cached_parse
+
+try:
+    import orjson  # Rust JSON encoder for economy_metrics.json
+except ImportError:
+    orjson = None
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
 
+# pandas / numpy are imported inside the parsing helpers that need them: importing
+# this module for its RAG bands or the energy-price loader stays cheap.
+
 # Output per hour RAG: Red <= 0.5%, 0.5% < Amber <= 1.5%, Green > 1.5%
 OUTPUT_PER_HOUR_RED_MAX = 0.5
 OUTPUT_PER_HOUR_AMBER_MAX = 1.5
 
+# First data row of an ONS generator CSV: a bare year ("2024"), a quarter ("2024 Q3")
+# or a range ("2023-24"). The metadata labels above it match none of these.
+ONS_PERIOD_LABEL_RE = re.compile(r"^\d+$|Q|-")
+# Quarterly period label, e.g. "2025 Q2" -> ("2025", "2").
+QUARTER_LABEL_RE = re.compile(r"^\s*(\d{4}) Q([1-4])\s*$")
+# Tag for the parsed-row memos kept beside cached CSVs; bump it when
+# _parse_csv_rows changes what it returns.
+ONS_CSV_PARSE_VERSION = "ons-csv-1"
+# ONS updates these series monthly at most: within this window a CSV already in the
+# cache (on disk or in a fetcher's memory) is reused without asking the server.
+ONS_CSV_MAX_AGE_SECONDS = 3600
+
+# metric_key -> (is_green, is_amber); a value passing neither is red. Built once at
+# import so classifying a point is one dict lookup and at most two tests.
+RAG_RULES = {
+    # Red <= 0.5%, 0.5% < Amber <= 1.5%, Green > 1.5%
+    "output_per_hour": (
+        lambda v: v > OUTPUT_PER_HOUR_AMBER_MAX,
+        lambda v: v > OUTPUT_PER_HOUR_RED_MAX,
+    ),
+    # Green: 1.5%-2.5%; Amber: 0%-1.49% and 2.6%-4%; Red: below 0% or above 4%
+    "cpi_inflation": (
+        lambda v: (1.5 <= v) & (v <= 2.5),
+        lambda v: ((0 <= v) & (v < 1.5)) | ((2.5 < v) & (v <= 4.0)),
+    ),
+    "real_gdp_growth": (
+        lambda v: v >= 2.0,
+        lambda v: v >= 1.0,
+    ),
+    # Green: 70% and below; Amber: 70%–85%; Red: 86%+
+    "public_sector_net_debt": (
+        lambda v: v <= 70,
+        lambda v: v <= 85,
+    ),
+    # Green: above 12%; Amber: 10%–12%; Red: below 10%
+    "business_investment": (
+        lambda v: v > 12,
+        lambda v: v >= 10,
+    ),
+}
+
 
 class ONSDataFetcher:
     # Real GDP Growth: ABMI/PN2 = Gross Domestic Product chained volume (£m SA). We compute YoY % growth from levels.
     # ONS CSV may contain annual and quarterly rows; we use quarterly only so the dashboard is not confused.
+    # Per-series flags: "quarterly" keeps only quarterly rows (sorted by quarter);
+    # "levels_to_yoy" turns a levels series into year-on-year % growth.
     SERIES_URLS = {
         "real_gdp_growth": {
             "url": "https://www.ons.gov.uk/generator?format=csv&uri=/economy/grossdomesticproductgdp/timeseries/abmi/pn2",
             "name": "Real GDP Growth",
             "unit": "%",
+            "quarterly": True,
+            "levels_to_yoy": True,
         },
         "cpi_inflation": {
             "url": "https://www.ons.gov.uk/generator?format=csv&uri=/economy/inflationandpriceindices/timeseries/d7g7/mm23",
@@ -46,6 +108,8 @@ class ONSDataFetcher:
             "url": "https://www.ons.gov.uk/generator?format=csv&uri=/economy/governmentpublicsectorandtaxes/publicsectorfinance/timeseries/hf6x/pusf",
             "name": "Public Sector Net Debt",
             "unit": "%",
+            # HF6X/PUSF: exclude annual and monthly rows.
+            "quarterly": True,
         },
     }
     # Business Investment = (NPEL / GDP) * 100 by quarter. NPEL = Business Investment £m CVM SA; GDP = ABMI (same as Real GDP growth levels).
@@ -55,45 +119,49 @@ class ONSDataFetcher:
     PLACEHOLDER_METRICS: List[Dict] = []
 
     def __init__(self):
+        # Every series lives on www.ons.gov.uk: one pooled keep-alive session, sized
+        # for the concurrent fetches, amortises the TCP/TLS handshakes. requests
+        # already sends Connection: keep-alive and advertises every content coding
+        # urllib3 can decode (gzip, deflate, plus br / zstd when the brotli /
+        # zstandard packages are installed), so Accept-Encoding is not pinned here:
+        # advertising br without a decoder would hand pandas compressed bytes.
+        # Transient gateway errors are retried with backoff.
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": "UK-RAG-Dashboard/1.0"})
+        self.session.mount("https://", requests.adapters.HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+        ))
+        # (fetched_at, parsed rows) per CSV URL. GDP growth and business investment
+        # both read ABMI and run concurrently in fetch_all_economy_metrics; the per-URL
+        # lock makes the second caller wait for the first download instead of
+        # repeating it.
+        self._csv_rows: Dict[str, Tuple[float, Optional[List[Dict]]]] = {}
+        self._csv_locks: Dict[str, threading.Lock] = {}
+        self._csv_locks_guard = threading.Lock()
 
     def calculate_rag_status(self, metric_key: str, value: float) -> str:
-        if metric_key == "output_per_hour":
-            # Red <= 0.5%, 0.5% < Amber <= 1.5%, Green > 1.5%
-            if value > OUTPUT_PER_HOUR_AMBER_MAX:
-                return "green"
-            if value > OUTPUT_PER_HOUR_RED_MAX:
-                return "amber"
-            return "red"
-        if metric_key == "cpi_inflation":
-            # Green: 1.5%-2.5%; Amber: 0%-1.49% and 2.6%-4%; Red: below 0% or above 4%
-            if 1.5 <= value <= 2.5:
-                return "green"
-            if (0 <= value < 1.5) or (2.5 < value <= 4.0):
-                return "amber"
-            return "red"
-        if metric_key == "real_gdp_growth":
-            if value >= 2.0:
-                return "green"
-            if value >= 1.0:
-                return "amber"
-            return "red"
-        if metric_key == "public_sector_net_debt":
-            # Green: 70% and below; Amber: 70%–85%; Red: 86%+
-            if value <= 70:
-                return "green"
-            if value <= 85:
-                return "amber"
-            return "red"
-        if metric_key == "business_investment":
-            # Green: above 12%; Amber: 10%–12%; Red: below 10%
-            if value > 12:
-                return "green"
-            if value >= 10:
-                return "amber"
-            return "red"
-        return "amber"
+        rule = RAG_RULES.get(metric_key)
+        if rule is None:
+            return "amber"
+        is_green, is_amber = rule
+        if is_green(value):
+            return "green"
+        if is_amber(value):
+            return "amber"
+        return "red"
+
+    def calculate_rag_statuses(self, metric_key: str, values) -> List[str]:
+        """Vectorised calculate_rag_status for a sequence of values (returns a list)."""
+        import numpy as np
+
+        values = np.asarray(values, dtype=float)
+        rule = RAG_RULES.get(metric_key)
+        if rule is None:
+            return ["amber"] * len(values)
+        is_green, is_amber = rule
+        return np.select([is_green(values), is_amber(values)], ["green", "amber"], default="red").tolist()
 
     @staticmethod
     def _parse_quarter(date_str: str) -> Optional[tuple]:
@@ -115,77 +183,168 @@ class ONSDataFetcher:
         return None
 
     @staticmethod
-    def _quarterly_rows_only(rows: List[Dict]) -> List[Dict]:
-        """Keep only rows whose date is quarterly (e.g. '2025 Q2'). Drops annual lines (e.g. '2024') so the dashboard is not confused by a mix of annual and quarterly."""
-        return [r for r in rows if "Q" in r.get("date", "") and ONSDataFetcher._parse_quarter(r["date"])]
+    def _parse_csv_rows(source) -> List[Dict]:
+        """
+        Parse an ONS generator CSV (a path or binary file object) into [{"date", "value"}] rows.
+
+        pandas' C tokenizer reads the whole file in one pass. The metadata block
+        (Title, CDID, Release date, ...) ends at the first row whose label looks like a
+        period (a year, quarter or range); rows after it with a blank or non-numeric
+        value are dropped.
+        """
+        import pandas as pd
+
+        df = pd.read_csv(
+            source,
+            header=None,
+            names=["date", "value"],
+            usecols=[0, 1],
+            dtype=str,
+            keep_default_na=False,
+            on_bad_lines="skip",
+            # Titles may carry a stray non-UTF-8 "£"; only the ASCII data rows matter.
+            encoding="utf-8-sig",
+            encoding_errors="replace",
+        )
+        dates = df["date"].str.strip()
+        is_period = dates.str.contains(ONS_PERIOD_LABEL_RE, na=False).to_numpy()
+        if not is_period.any():
+            return []
+        start = int(is_period.argmax())
+        values = pd.to_numeric(df["value"].iloc[start:].str.strip(), errors="coerce")
+        keep = values.notna()
+        return [
+            {"date": date, "value": value}
+            for date, value in zip(dates.iloc[start:][keep].tolist(), values[keep].tolist())
+        ]
+
+    @staticmethod
+    def _keyed_quarters(rows: List[Dict]) -> List[Tuple[Tuple[int, int], Dict]]:
+        """
+        Quarterly rows (e.g. '2025 Q2') as [((year, quarter), row)], sorted by that key.
+
+        Annual and monthly lines are dropped so the dashboard is not confused by a mix
+        of frequencies. Each label is parsed once; the (year, quarter) tuples then serve
+        as the sort key and as lookup keys without re-parsing. The sort is stable, so
+        duplicate quarters keep their CSV order.
+        """
+        keyed = [(ONSDataFetcher._parse_quarter(r.get("date", "")), r) for r in rows]
+        keyed = [(pq, r) for pq, r in keyed if pq]
+        keyed.sort(key=itemgetter(0))
+        return keyed
 
     @staticmethod
     def _levels_to_yoy_growth(rows: List[Dict]) -> List[Dict]:
         """Convert GDP level rows (£m) to year-on-year % growth. Uses quarterly rows only (same quarter, previous year). Annual rows are not used."""
-        quarterly = ONSDataFetcher._quarterly_rows_only(rows)
-        if not quarterly:
+        import numpy as np
+        import pandas as pd
+
+        df = pd.DataFrame(rows, columns=["date", "value"])
+        yq = df["date"].str.extract(QUARTER_LABEL_RE).dropna()
+        df = df.loc[yq.index]
+        if df.empty:
             return []
-        # Sort by (year, quarter)
-        def sort_key(x):
-            pq = ONSDataFetcher._parse_quarter(x["date"])
-            return (pq[0], pq[1]) if pq else (0, 0)
-        quarterly.sort(key=sort_key)
-        # Map (year, quarter) -> value
-        by_yq = {}
-        for r in quarterly:
-            pq = ONSDataFetcher._parse_quarter(r["date"])
-            if pq:
-                by_yq[pq] = r["value"]
-        out = []
-        for r in quarterly:
-            pq = ONSDataFetcher._parse_quarter(r["date"])
-            if not pq:
-                continue
-            y, q = pq
-            prev_yq = (y - 1, q)
-            if prev_yq not in by_yq:
-                continue
-            prev_val = by_yq[prev_yq]
-            if prev_val and prev_val != 0:
-                growth_pct = ((r["value"] - prev_val) / prev_val) * 100.0
-                out.append({"date": r["date"], "value": round(growth_pct, 2)})
-        return out
-
-    def _fetch_quarterly_levels(self, url: str, series_name: str) -> List[Dict]:
-        """Fetch ONS CSV and return quarterly rows with valid numeric values only (date, value). Skips empty values."""
+        # Quarters as consecutive integers, so "same quarter last year" is quarter - 4
+        # even when the series has gaps.
+        df = df.assign(quarter=yq[0].astype(int) * 4 + yq[1].astype(int) - 1)
+        # ONS publishes series oldest-first, so the sort is normally a no-op.
+        if not df["quarter"].is_monotonic_increasing:
+            df = df.sort_values("quarter", kind="stable")
+        levels = df.drop_duplicates("quarter", keep="last").set_index("quarter")["value"]
+        prev = levels.reindex(df["quarter"] - 4).to_numpy()
+        value = df["value"].to_numpy(dtype=float)
+        usable = ~np.isnan(prev) & (prev != 0)
+        growth = (value[usable] - prev[usable]) / prev[usable] * 100.0
+        return [
+            {"date": date, "value": round(pct, 2)}
+            for date, pct in zip(df["date"][usable].tolist(), growth.tolist())
+        ]
+
+    def _build_results(
+        self,
+        metric_key: str,
+        metric_name: str,
+        unit: str,
+        source_url: str,
+        rows: List[Dict],
+        historical: bool,
+    ):
+        """Metric dicts for every row (historical: a list) or for the latest row only (a dict)."""
+        if historical:
+            rags = self.calculate_rag_statuses(metric_key, [row["value"] for row in rows])
+        else:
+            rows = rows[-1:]
+            rags = [self.calculate_rag_status(metric_key, rows[0]["value"])]
+        # Fields shared by every row, built (and timestamped) once; each row only fills
+        # in value / time_period / rag_status, which keep their place in the key order.
+        base = {
+            "metric_name": metric_name,
+            "metric_key": metric_key,
+            "category": "Economy",
+            "value": None,
+            "time_period": None,
+            "unit": unit,
+            "rag_status": None,
+            "data_source": "ONS",
+            "source_url": source_url,
+            "last_updated": datetime.utcnow().isoformat(),
+        }
+        results = [
+            {**base, "value": row["value"], "time_period": row["date"], "rag_status": rag}
+            for row, rag in zip(rows, rags)
+        ]
+        return results if historical else results[0]
+
+    def _fetch_csv_rows(self, url: str, series_name: str) -> Optional[List[Dict]]:
+        """
+        Rows of the ONS CSV at url, downloaded at most once per ONS_CSV_MAX_AGE_SECONDS per fetcher.
+
+        Failed downloads are not memoised, so the next caller retries; the per-URL
+        lock still makes a concurrent caller wait for the one in flight.
+        """
+        with self._csv_locks_guard:
+            lock = self._csv_locks.setdefault(url, threading.Lock())
+        with lock:
+            fetched_at, rows = self._csv_rows.get(url, (None, None))
+            if fetched_at is None or time.monotonic() - fetched_at >= ONS_CSV_MAX_AGE_SECONDS:
+                rows = self._download_csv_rows(url, series_name)
+                if rows is not None:
+                    self._csv_rows[url] = (time.monotonic(), rows)
+            return rows
+
+    def _download_csv_rows(self, url: str, series_name: str) -> Optional[List[Dict]]:
+        """
+        Download an ONS generator CSV through the on-disk HTTP cache and parse it.
+
+        ONS republishes these series at most monthly; a CSV checked within the last
+        ONS_CSV_MAX_AGE_SECONDS is reused without a request, an unchanged one
+        costs a 304 round-trip (see http_cache) and its parsed rows are reloaded from the memo
+        stored beside it, so pandas is not even imported for it.
+
+        Returns None (after logging) when the download or the parse fails. Only
+        network/file errors and malformed-CSV errors are caught; anything else is a
+        bug and propagates.
+        """
+        try:
+            body_path = cached_download(self.session, url, 30, max_age=ONS_CSV_MAX_AGE_SECONDS)
+        except (requests.RequestException, OSError) as e:
+            logger.error("Download failed for %s: %r", series_name, e)
+            return None
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            lines = response.text.strip().split("\n")
-            data_start = 0
-            for i, line in enumerate(lines):
-                if line.startswith('"') and len(line.split('","')) == 2:
-                    first_field = line.split('","')[0].strip('"')
-                    if first_field.isdigit() or "Q" in first_field or "-" in first_field:
-                        data_start = i
-                        break
-            if data_start == 0:
-                logger.warning("Could not find data start for %s", series_name)
-                return []
-            data_rows = []
-            for line in lines[data_start:]:
-                if line.strip():
-                    parts = line.strip('"').split('","')
-                    if len(parts) == 2:
-                        date_str, value_str = parts
-                        date_str = date_str.strip()
-                        value_str = value_str.strip()
-                        if not value_str:
-                            continue
-                        try:
-                            val = float(value_str)
-                            data_rows.append({"date": date_str, "value": val})
-                        except ValueError:
-                            continue
-            return self._quarterly_rows_only(data_rows)
-        except Exception as e:
-            logger.exception("Failed to fetch quarterly levels for %s: %s", series_name, e)
+            return cached_parse(body_path, self._parse_csv_rows, ONS_CSV_PARSE_VERSION)
+        except (ValueError, KeyError, IndexError) as e:
+            logger.error("Parse failed for %s: %r", series_name, e)
+            return None
+
+    def _fetch_quarterly_levels(self, url: str, series_name: str) -> List[Tuple[Tuple[int, int], Dict]]:
+        """Fetch ONS CSV and return its quarterly rows with valid numeric values only, keyed and sorted by (year, quarter)."""
+        data_rows = self._fetch_csv_rows(url, series_name)
+        if data_rows is None:
+            return []
+        if not data_rows:
+            logger.warning("Could not find data start for %s", series_name)
             return []
+        return self._keyed_quarters(data_rows)
 
     def fetch_business_investment_pct(self, historical: bool = False) -> Optional[Dict]:
         """Business Investment as % of GDP: (NPEL / ABMI) * 100 for each quarter. Same-quarter comparison (e.g. Q3 25 vs Q3 25 GDP)."""
@@ -194,56 +353,19 @@ class ONSDataFetcher:
         if not npel_rows or not gdp_rows:
             logger.warning("Missing NPEL or GDP quarterly data for Business Investment")
             return None
-        gdp_by_yq = {}
-        for r in gdp_rows:
-            pq = self._parse_quarter(r["date"])
-            if pq:
-                gdp_by_yq[pq] = r["value"]
+        gdp_by_yq = {pq: r["value"] for pq, r in gdp_rows}
         out = []
-        for r in npel_rows:
-            pq = self._parse_quarter(r["date"])
-            if not pq or pq not in gdp_by_yq:
-                continue
-            gdp = gdp_by_yq[pq]
-            if gdp and gdp != 0:
+        for pq, r in npel_rows:
+            gdp = gdp_by_yq.get(pq)
+            if gdp:
                 pct = (r["value"] / gdp) * 100.0
                 out.append({"date": r["date"], "value": round(pct, 2)})
         if not out:
             return None
-        def sort_key(x):
-            pq = self._parse_quarter(x["date"])
-            return (pq[0], pq[1]) if pq else (0, 0)
-        out.sort(key=sort_key)
-        source_url = self.BUSINESS_INVESTMENT_NPEL_URL
-        if historical:
-            return [
-                {
-                    "metric_name": "Business Investment",
-                    "metric_key": "business_investment",
-                    "category": "Economy",
-                    "value": row["value"],
-                    "time_period": row["date"],
-                    "unit": "%",
-                    "rag_status": self.calculate_rag_status("business_investment", row["value"]),
-                    "data_source": "ONS",
-                    "source_url": source_url,
-                    "last_updated": datetime.utcnow().isoformat(),
-                }
-                for row in out
-            ]
-        latest = out[-1]
-        return {
-            "metric_name": "Business Investment",
-            "metric_key": "business_investment",
-            "category": "Economy",
-            "value": latest["value"],
-            "time_period": latest["date"],
-            "unit": "%",
-            "rag_status": self.calculate_rag_status("business_investment", latest["value"]),
-            "data_source": "ONS",
-            "source_url": source_url,
-            "last_updated": datetime.utcnow().isoformat(),
-        }
+        return self._build_results(
+            "business_investment", "Business Investment", "%",
+            self.BUSINESS_INVESTMENT_NPEL_URL, out, historical,
+        )
 
     def fetch_csv_series(self, metric_key: str, historical: bool = False) -> Optional[Dict]:
         if metric_key not in self.SERIES_URLS:
@@ -251,97 +373,42 @@ class ONSDataFetcher:
         config = self.SERIES_URLS[metric_key]
         url = config["url"]
         metric_name = config["name"]
-        try:
-            logger.info("Fetching %s", metric_name)
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            lines = response.text.strip().split("\n")
-            data_start = 0
-            for i, line in enumerate(lines):
-                if line.startswith('"') and len(line.split('","')) == 2:
-                    first_field = line.split('","')[0].strip('"')
-                    if first_field.isdigit() or "Q" in first_field or "-" in first_field:
-                        data_start = i
-                        break
-            if data_start == 0:
-                logger.error("Could not find data start for %s", metric_name)
+        logger.info("Fetching %s", metric_name)
+        data_rows = self._fetch_csv_rows(url, metric_name)
+        if data_rows is None:
+            return None
+        if not data_rows:
+            logger.error("No valid data for %s", metric_name)
+            return None
+        if config.get("quarterly"):
+            data_rows = [r for _, r in self._keyed_quarters(data_rows)]
+            if not data_rows:
+                logger.warning("No quarterly rows for %s (only annual or monthly in CSV)", metric_name)
                 return None
-            data_rows = []
-            for line in lines[data_start:]:
-                if line.strip():
-                    parts = line.strip('"').split('","')
-                    if len(parts) == 2:
-                        date_str, value_str = parts
-                        try:
-                            data_rows.append({"date": date_str, "value": float(value_str)})
-                        except ValueError:
-                            continue
+        if config.get("levels_to_yoy"):
+            data_rows = self._levels_to_yoy_growth(data_rows)
             if not data_rows:
-                logger.error("No valid data for %s", metric_name)
+                logger.error("Could not compute YoY growth for %s", metric_name)
                 return None
-            # For Real GDP (ABMI/PN2), ONS CSV can contain both annual and quarterly rows; remove all annual lines and use only quarterly so the dashboard is not confused.
-            if metric_key == "real_gdp_growth":
-                data_rows = self._quarterly_rows_only(data_rows)
-                if not data_rows:
-                    logger.warning("No quarterly rows for Real GDP Growth (only annual or other period types in CSV)")
-                    return None
-            # Public Sector Net Debt (HF6X/PUSF): keep only quarterly rows; exclude annual and monthly.
-            if metric_key == "public_sector_net_debt":
-                data_rows = self._quarterly_rows_only(data_rows)
-                if not data_rows:
-                    logger.warning("No quarterly rows for Public Sector Net Debt (only annual or monthly in CSV)")
-                    return None
-                def _sort_quarterly(rows):
-                    def key(r):
-                        pq = self._parse_quarter(r.get("date", ""))
-                        return (pq[0], pq[1]) if pq else (0, 0)
-                    return sorted(rows, key=key)
-                data_rows = _sort_quarterly(data_rows)
-            # ABMI/PN2 is levels (£m); convert to YoY % growth for real_gdp_growth
-            if metric_key == "real_gdp_growth":
-                data_rows = self._levels_to_yoy_growth(data_rows)
-                if not data_rows:
-                    logger.error("Could not compute YoY growth for Real GDP Growth")
-                    return None
-            if historical:
-                return [
-                    {
-                        "metric_name": metric_name,
-                        "metric_key": metric_key,
-                        "category": "Economy",
-                        "value": row["value"],
-                        "time_period": row["date"],
-                        "unit": config["unit"],
-                        "rag_status": self.calculate_rag_status(metric_key, row["value"]),
-                        "data_source": "ONS",
-                        "source_url": url,
-                        "last_updated": datetime.utcnow().isoformat(),
-                    }
-                    for row in data_rows
-                ]
-            latest = data_rows[-1]
-            return {
-                "metric_name": metric_name,
-                "metric_key": metric_key,
-                "category": "Economy",
-                "value": latest["value"],
-                "time_period": latest["date"],
-                "unit": config["unit"],
-                "rag_status": self.calculate_rag_status(metric_key, latest["value"]),
-                "data_source": "ONS",
-                "source_url": url,
-                "last_updated": datetime.utcnow().isoformat(),
-            }
-        except Exception as e:
-            logger.exception("Failed to fetch %s: %s", metric_name, e)
-            return None
+        return self._build_results(metric_key, metric_name, config["unit"], url, data_rows, historical)
 
     def fetch_all_economy_metrics(self, historical: bool = False) -> Dict[str, Optional[Dict]]:
-        results = {}
-        for key in self.SERIES_URLS:
-            results[key] = self.fetch_csv_series(key, historical=historical)
+        jobs = {key: partial(self.fetch_csv_series, key, historical=historical) for key in self.SERIES_URLS}
         # Business Investment = (NPEL / GDP) * 100 by quarter
-        results["business_investment"] = self.fetch_business_investment_pct(historical=historical)
+        jobs["business_investment"] = partial(self.fetch_business_investment_pct, historical=historical)
+        # The downloads are independent and I/O-bound, so run them in threads: a
+        # refresh waits for the slowest series rather than the sum of all of them.
+        with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+            futures = {key: pool.submit(job) for key, job in jobs.items()}
+        results = {}
+        for key, future in futures.items():
+            # The fetchers only catch download and parse errors. Anything else is a
+            # bug: log it with its traceback but lose only that series, not the run.
+            try:
+                results[key] = future.result()
+            except Exception:
+                logger.exception("Unexpected error fetching %s", key)
+                results[key] = None
         return results
 
 
@@ -451,117 +518,120 @@ def fetch_energy_prices_data() -> Optional[Dict[str, Any]]:
     collection. Falls back to a hardcoded baseline if the collection is
     empty/unreachable so the tile never silently regresses to placeholder.
     """
-    try:
-        component = load_ofgem_price_cap()
-        if component is None:
-            logger.info(
-                "economy_components: no ofgem_price_cap row found; "
-                "using fallback baseline"
-            )
-            component = _ofgem_cap_fallback()
-            data_source_label = "Ofgem default tariff cap (fallback baseline)"
-        else:
-            data_source_label = (
-                "economy_components collection (Ofgem default tariff cap)"
-            )
-
-        value = int(round(float(component["value"])))
-        rag = calculate_energy_prices_rag(value)
-
-        now = datetime.utcnow()
-        quarter = (now.month - 1) // 3 + 1
-        time_period = f"{now.year} Q{quarter}"
-
-        effective_period = component.get("effectivePeriod", "")
-        source_url = component.get("sourceUrl", "")
-        source_title = component.get("sourceTitle", "")
-
-        information = (
-            f"Energy Prices for {time_period} = the Ofgem default tariff "
-            f"cap of \u00a3{value:,}/year for a typical UK household "
-            f"(dual-fuel, paying by Direct Debit). Effective period: "
-            f"{effective_period}. The cap is published by Ofgem and updated "
-            f"quarterly (1 Jan, 1 Apr, 1 Jul, 1 Oct), announced roughly six "
-            f"weeks before each effective quarter.\n\n"
-            f"Source: {source_title} ({source_url})\n\n"
-            f"RAG bands are anchored against the pre-energy-crisis 2019 "
-            f"baseline (~\u00a31,190/year): green at or below \u00a31,400, "
-            f"amber up to \u00a32,000, red above \u00a32,000."
-        )
-
-        metric = {
-            "metric_name": "Energy Prices",
-            "metric_key": "energy_prices",
-            "category": "Economy",
-            "value": value,
-            "time_period": time_period,
-            # Unit is intentionally empty: the \u00a3 symbol is rendered as a
-            # prefix by formatValue() on the client (POUND_PREFIX_KEYS), so
-            # if we also set unit="\u00a3" here Home.tsx and MetricDetail.tsx
-            # would append it again as a suffix ("\u00a31,641 \u00a3").
-            "unit": "",
-            "rag_status": rag,
-            "data_source": data_source_label,
-            "source_url": source_url
-                or "https://www.ofgem.gov.uk/energy-policy-and-regulation/policy-and-regulatory-programmes/energy-price-cap-default-tariff-policy/energy-price-cap-default-tariff-levels",
-            "last_updated": datetime.utcnow().isoformat(),
-            "information": information,
-        }
+    component = load_ofgem_price_cap()
+    if component is None:
         logger.info(
-            "Energy Prices: \u00a3%s/yr (%s) for %s",
-            f"{value:,}", rag.upper(), time_period,
+            "economy_components: no ofgem_price_cap row found; "
+            "using fallback baseline"
         )
-        return metric
-    except Exception as e:
-        logger.exception("Failed to fetch energy prices: %s", e)
+        component = _ofgem_cap_fallback()
+        data_source_label = "Ofgem default tariff cap (fallback baseline)"
+    else:
+        data_source_label = (
+            "economy_components collection (Ofgem default tariff cap)"
+        )
+
+    try:
+        value = int(round(float(component["value"])))
+    except (KeyError, TypeError, ValueError) as e:
+        logger.error("Energy Prices: unusable ofgem_price_cap value: %r", e)
         return None
+    rag = calculate_energy_prices_rag(value)
+
+    now = datetime.utcnow()
+    quarter = (now.month - 1) // 3 + 1
+    time_period = f"{now.year} Q{quarter}"
+
+    effective_period = component.get("effectivePeriod", "")
+    source_url = component.get("sourceUrl", "")
+    source_title = component.get("sourceTitle", "")
+
+    information = (
+        f"Energy Prices for {time_period} = the Ofgem default tariff "
+        f"cap of \u00a3{value:,}/year for a typical UK household "
+        f"(dual-fuel, paying by Direct Debit). Effective period: "
+        f"{effective_period}. The cap is published by Ofgem and updated "
+        f"quarterly (1 Jan, 1 Apr, 1 Jul, 1 Oct), announced roughly six "
+        f"weeks before each effective quarter.\n\n"
+        f"Source: {source_title} ({source_url})\n\n"
+        f"RAG bands are anchored against the pre-energy-crisis 2019 "
+        f"baseline (~\u00a31,190/year): green at or below \u00a31,400, "
+        f"amber up to \u00a32,000, red above \u00a32,000."
+    )
 
+    metric = {
+        "metric_name": "Energy Prices",
+        "metric_key": "energy_prices",
+        "category": "Economy",
+        "value": value,
+        "time_period": time_period,
+        # Unit is intentionally empty: the \u00a3 symbol is rendered as a
+        # prefix by formatValue() on the client (POUND_PREFIX_KEYS), so
+        # if we also set unit="\u00a3" here Home.tsx and MetricDetail.tsx
+        # would append it again as a suffix ("\u00a31,641 \u00a3").
+        "unit": "",
+        "rag_status": rag,
+        "data_source": data_source_label,
+        "source_url": source_url
+            or "https://www.ofgem.gov.uk/energy-policy-and-regulation/policy-and-regulatory-programmes/energy-price-cap-default-tariff-policy/energy-price-cap-default-tariff-levels",
+        "last_updated": now.isoformat(),
+        "information": information,
+    }
+    logger.info(
+        "Energy Prices: \u00a3%s/yr (%s) for %s",
+        f"{value:,}", rag.upper(), time_period,
+    )
+    return metric
 
-def main():
-    import sys
 
-    historical = "--historical" in sys.argv or "-h" in sys.argv
-    fetcher = ONSDataFetcher()
-    results = fetcher.fetch_all_economy_metrics(historical=historical)
-    rag_results = []
-    if historical:
-        for key, data in results.items():
+def _dumps_metric(metric: Dict[str, Any]) -> str:
+    """Serialise one metric row as indented JSON (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(metric, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(metric, indent=2)
+
+
+def _write_metrics(f, metrics: Iterable[Dict[str, Any]]) -> int:
+    """
+    Stream metric rows into f as an indented JSON array and return how many were written.
+
+    Rows are encoded and written one at a time, so the whole document is never held
+    in memory as one string. The output parses to the same JSON as
+    json.dump(rows, f, indent=2) (non-ASCII is written as UTF-8); the dashboard
+    loaders parse this file as one array, so it stays an array rather than
+    becoming NDJSON.
+    """
+    count = 0
+    for metric in metrics:
+        f.write(",\n  " if count else "[\n  ")
+        # JSON escapes newlines inside strings, so every raw newline is structural.
+        f.write(_dumps_metric(metric).replace("\n", "\n  "))
+        count += 1
+    f.write("\n]" if count else "[]")
+    return count
+
+
+def _output_rows(results: Dict[str, Any], historical: bool, now_iso: str) -> Iterator[Dict[str, Any]]:
+    """Yield the economy_metrics.json rows: fetched series, placeholders, then Energy Prices."""
+    for data in results.values():
+        if historical:
             if data and isinstance(data, list):
-                rag_results.extend(data)
-        for p in ONSDataFetcher.PLACEHOLDER_METRICS:
-            rag_results.append(
-                {
-                    "metric_name": p["name"],
-                    "metric_key": p["metric_key"],
-                    "category": "Economy",
-                    "value": "placeholder",
-                    "time_period": "",
-                    "unit": p["unit"],
-                    "rag_status": "amber",
-                    "data_source": "Placeholder",
-                    "source_url": "",
-                    "last_updated": datetime.utcnow().isoformat(),
-                }
-            )
-    else:
-        for key, data in results.items():
-            if data:
-                rag_results.append(data)
-        for p in ONSDataFetcher.PLACEHOLDER_METRICS:
-            rag_results.append(
-                {
-                    "metric_name": p["name"],
-                    "metric_key": p["metric_key"],
-                    "category": "Economy",
-                    "value": "placeholder",
-                    "time_period": "",
-                    "unit": p["unit"],
-                    "rag_status": "amber",
-                    "data_source": "Placeholder",
-                    "source_url": "",
-                    "last_updated": datetime.utcnow().isoformat(),
-                }
-            )
+                yield from data
+        elif data:
+            yield data
+    for p in ONSDataFetcher.PLACEHOLDER_METRICS:
+        yield {
+            "metric_name": p["name"],
+            "metric_key": p["metric_key"],
+            "category": "Economy",
+            "value": "placeholder",
+            "time_period": "",
+            "unit": p["unit"],
+            "rag_status": "amber",
+            "data_source": "Placeholder",
+            "source_url": "",
+            "last_updated": now_iso,
+        }
 
     # Energy Prices (Ofgem default tariff cap) — sourced from the
     # economy_components collection with hardcoded fallback. Always emit a
@@ -569,14 +639,25 @@ def main():
     # quarterly so a single point per refresh is correct.
     energy = fetch_energy_prices_data()
     if energy:
-        rag_results.append(energy)
+        yield energy
+
+
+def main():
+    import sys
+
+    historical = "--historical" in sys.argv or "-h" in sys.argv
+    fetcher = ONSDataFetcher()
+    results = fetcher.fetch_all_economy_metrics(historical=historical)
+    now_iso = datetime.utcnow().isoformat()
+    rag_results = list(_output_rows(results, historical, now_iso))
 
     output_file = path.join(path.dirname(__file__), "economy_metrics.json")
     tmp_file = output_file + ".tmp"
-    with open(tmp_file, "w") as f:
-        json.dump(rag_results, f, indent=2)
+    # orjson writes non-ASCII (the "£" in the energy tile text) as UTF-8 rather than \u escapes.
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        count = _write_metrics(f, rag_results)
     os.rename(tmp_file, output_file)
-    logger.info("Results saved to %s", output_file)
+    logger.info("Saved %d rows to %s", count, output_file)
     return rag_results
 
 
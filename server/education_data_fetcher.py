@@ -8,14 +8,40 @@ NEET (16-24): ONS Young People NEET | Persistent Absence: DfE Pupil Absence | Ap
 
 import requests
 import pandas as pd
+import csv
 import gzip
-import io
+import logging
 import re
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import json
 import openpyxl
+from urllib3.util.retry import Retry
+
+from http_cache import cached_download
+from metric_cache import FRESH_HOURS, load_metric, save_metric
+from rag import rag_status, rag_statuses, signed_table
+
+try:
+    import orjson  # Rust JSON encoder for the stdout payload
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# One keep-alive session for every fetch in this module. The fetchers run
+# concurrently (fetch_all_education_metrics) and several hit the same DfE / ONS
+# hosts, so pooled connections save a TCP + TLS handshake per request. The pool
+# holds one connection per concurrent fetcher; transient gateway errors are
+# retried with backoff.
+http_session = requests.Session()
+http_session.mount("https://", requests.adapters.HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+))
 
 # RAG Thresholds for Education Metrics
 RAG_THRESHOLDS = {
@@ -56,83 +82,136 @@ RAG_THRESHOLDS = {
     },
 }
 
+# Metrics where a higher value is better; every other metric is lower-is-better,
+# and is green / amber only while strictly below its threshold.
+HIGHER_IS_BETTER = ("attainment8", "apprentice_starts", "university_education_quality")
+
+# Built once at import so classification is one dict lookup plus two comparisons.
+_RAG_TABLE = signed_table(RAG_THRESHOLDS, HIGHER_IS_BETTER, strict_lower=True)
+
+# First bytes of a gzip stream. DfE's data API can send a gzipped CSV without a
+# Content-Encoding header, so the body itself has to be sniffed.
+GZIP_MAGIC = b"\x1f\x8b"
+# DfE republishes these datasets quarterly or annually: a CSV checked within this
+# window is reused from the on-disk cache without a request.
+DFE_CSV_MAX_AGE_SECONDS = 6 * 3600
+
+# Columns read from each DfE CSV; the breakdown columns may be absent.
+ATTAINMENT8_COLUMNS = {"time_period", "geographic_level", "school_type", "attainment8_average"}
+APPRENTICE_STARTS_COLUMNS = {
+    "time_period", "geographic_level", "age_summary", "std_fwk_flag", "apps_level",
+    "funding_type", "start_month", "starts",
+}
+# Low-cardinality filter columns, parsed as categoricals so that == "National" /
+# == "Total" compares integer codes. Keys missing from a file are ignored.
+DFE_CATEGORY_DTYPES = dict.fromkeys(
+    ["geographic_level", "school_type", "age_summary", "std_fwk_flag",
+     "apps_level", "funding_type", "start_month"],
+    "category",
+)
+# Rows per chunk when filtering a DfE CSV down to its National rows.
+CSV_CHUNK_ROWS = 100_000
+
+
+def _read_csv_file(path, **read_csv_kwargs):
+    """Parse a downloaded CSV with pandas, whether or not its bytes are gzipped."""
+    with open(path, "rb") as f:
+        compression = "gzip" if f.read(2) == GZIP_MAGIC else None
+    return pd.read_csv(path, compression=compression, **read_csv_kwargs)
+
+
+def _iter_csv_rows(path):
+    """Yield each row of a downloaded CSV as a dict, whether or not its bytes are gzipped."""
+    with open(path, "rb") as f:
+        gzipped = f.read(2) == GZIP_MAGIC
+    with (gzip.open if gzipped else open)(path, "rt", encoding="utf-8-sig", newline="") as f:
+        yield from csv.DictReader(f)
+
+
+def _download_dfe_csv(url, **read_csv_kwargs):
+    """
+    Download a DfE CSV through the on-disk HTTP cache and parse it with pandas.
+
+    An unchanged dataset costs a conditional GET answered with 304 (or nothing at
+    all within DFE_CSV_MAX_AGE_SECONDS; see http_cache), and the body is
+    streamed to disk rather than held in memory.
+    """
+    return _read_csv_file(
+        cached_download(http_session, url, 30, max_age=DFE_CSV_MAX_AGE_SECONDS),
+        **read_csv_kwargs,
+    )
+
+
 def calculate_rag_status(metric_name, value):
     """Calculate RAG status based on thresholds (returns lowercase)"""
-    if metric_name not in RAG_THRESHOLDS:
-        return "amber"
-    
-    thresholds = RAG_THRESHOLDS[metric_name]
-    
-    # For attainment8 (higher is better)
-    if metric_name == "attainment8":
-        if value >= thresholds["green"]:
-            return "green"
-        elif value >= thresholds["amber"]:
-            return "amber"
-        else:
-            return "red"
-    
-    # For apprentice_starts (higher is better)
-    if metric_name == "apprentice_starts":
-        if value >= thresholds["green"]:
-            return "green"
-        elif value >= thresholds["amber"]:
-            return "amber"
-        else:
-            return "red"
-
-    # For university_education_quality composite (higher is better)
-    if metric_name == "university_education_quality":
-        if value >= thresholds["green"]:
-            return "green"
-        elif value >= thresholds["amber"]:
-            return "amber"
-        else:
-            return "red"
-    
-    # For vacancy and NEET rates (lower is better)
-    if value < thresholds["green"]:
-        return "green"
-    elif value < thresholds["amber"]:
-        return "amber"
-    else:
-        return "red"
-
-def fetch_attainment8_data():
+    return rag_status(_RAG_TABLE, metric_name, value)
+
+def calculate_rag_statuses(metric_name, values):
+    """Vectorised calculate_rag_status for a sequence of values (returns a list)."""
+    return rag_statuses(_RAG_TABLE, metric_name, values)
+
+def _education_metric(fields, now=None, rag_value=None):
+    """
+    Complete an Education metric row from the fields its fetcher knows.
+
+    fields holds metric_name, metric_key, value, time_period, data_source and
+    source_url, plus any extras (information, unit). Category, RAG status and
+    timestamp are filled in here, in the key order every row uses. now is the
+    run's timestamp (default: the current time); rag_value is the figure to
+    classify when the reported value has been rounded.
+    """
+    metric = {
+        "metric_name": fields["metric_name"],
+        "metric_key": fields["metric_key"],
+        "category": "Education",
+        "value": fields["value"],
+        "rag_status": calculate_rag_status(
+            fields["metric_key"], fields["value"] if rag_value is None else rag_value,
+        ),
+        "time_period": fields["time_period"],
+        "data_source": fields["data_source"],
+        "source_url": fields["source_url"],
+        "last_updated": (now or datetime.now()).isoformat(),
+    }
+    metric.update(fields)
+    return metric
+
+def fetch_attainment8_data(now=None):
     """
     Fetch Key Stage 4 Attainment 8 data from DfE API
     Returns national average Attainment 8 score for latest year
     """
     url = "https://api.education.gov.uk/statistics/v1/data-sets/b3e19901-5d2b-b676-bb4c-e60937d74725/csv?dataSetVersion=1.0"
     
+    cached = load_metric("attainment8", max_age_hours=FRESH_HOURS)
+    if cached:
+        print(f"Attainment 8: reusing result saved within {FRESH_HOURS:g}h")
+        # Restamp with this run's time so every row of a run shares last_updated.
+        return {**cached, "last_updated": (now or datetime.now()).isoformat()}
     try:
         print(f"Fetching Attainment 8 data from: {url}")
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        
-        # Check if content is gzip compressed
-        try:
-            # Try to decompress
-            decompressed = gzip.decompress(response.content)
-            df = pd.read_csv(io.BytesIO(decompressed))
-        except gzip.BadGzipFile:
-            # Content is not compressed, read directly
-            df = pd.read_csv(io.BytesIO(response.content))
-        
-        print(f"Downloaded {len(df)} rows")
-        print(f"Columns: {df.columns.tolist()}")
-        
         # Filter for:
         # - National level
         # - Latest time period (2024/25)
         # - All pupils (no specific characteristic filters)
-        
-        # First, let's see what columns we have
-        print(f"\\nSample data (first 5 rows):")
-        print(df.head())
-        
-        # Filter for national level data
-        national_data = df[df['geographic_level'] == 'National']
+        #
+        # The file is mostly regional / LA / school rows: read only the columns used
+        # below, in chunks, keeping just the National rows of each chunk.
+        with _download_dfe_csv(
+            url,
+            usecols=lambda column: column in ATTAINMENT8_COLUMNS,
+            dtype=DFE_CATEGORY_DTYPES,
+            chunksize=CSV_CHUNK_ROWS,
+        ) as chunks:
+            national_data = pd.concat(
+                chunk[chunk['geographic_level'] == 'National'] for chunk in chunks
+            )
+
+        print(f"Kept {len(national_data)} national rows")
+        # Rendering a DataFrame is not free: only do it when debugging.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Attainment 8 columns: %s", national_data.columns.tolist())
+            logger.debug("Attainment 8 sample rows:\n%s", national_data.head())
         
         if national_data.empty:
             print("Warning: No national level data found")
@@ -164,35 +243,28 @@ def fetch_attainment8_data():
             print(f"Warning: 'attainment8_average' column not found. Available columns: {all_pupils.columns.tolist()}")
             return None
         
-        # Calculate RAG status
-        rag_status = calculate_rag_status("attainment8", attainment8_value)
-        
-        result = {
+        result = _education_metric({
             "metric_name": "Attainment 8 Score",
             "metric_key": "attainment8",
-            "category": "Education",
             "value": attainment8_value,
-            "rag_status": rag_status,
             "time_period": str(latest_period),
             "data_source": "DfE: KS4 Performance",
             "source_url": "https://explore-education-statistics.service.gov.uk/find-statistics/key-stage-4-performance",
-            "last_updated": datetime.now().isoformat()
-        }
+        }, now=now)
         
         print(f"\\nAttainment 8 Result:")
         print(f"  Value: {attainment8_value}")
-        print(f"  RAG Status: {rag_status}")
+        print(f"  RAG Status: {result['rag_status']}")
         print(f"  Time Period: {latest_period}")
         
+        save_metric(result)
         return result
         
     except Exception as e:
-        print(f"Error fetching Attainment 8 data: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error fetching Attainment 8 data: %s", e)
         return None
 
-def fetch_teacher_vacancy_data():
+def fetch_teacher_vacancy_data(now=None):
     """
     Fetch School Workforce teacher vacancy data
     Note: This is a placeholder - actual URL needs to be found
@@ -201,17 +273,14 @@ def fetch_teacher_vacancy_data():
     print("Need to find the correct dataset URL from DfE")
     
     # Placeholder data
-    return {
+    return _education_metric({
         "metric_name": "Teacher Vacancy Rate",
         "metric_key": "teacher_vacancy_rate",
-        "category": "Education",
         "value": 1.5,  # Placeholder
-        "rag_status": "amber",
         "time_period": "2024",
         "data_source": "DfE: School Workforce",
         "source_url": "https://explore-education-statistics.service.gov.uk/find-statistics/school-workforce-in-england",
-        "last_updated": datetime.now().isoformat()
-    }
+    }, now=now)
 
 NEET_QUARTER_MAP = {
     "Jan-Mar": "Q1", "Apr-Jun": "Q2", "Jul-Sep": "Q3", "Oct-Dec": "Q4",
@@ -220,14 +289,14 @@ NEET_QUARTER_MAP = {
 def _download_neet_xlsx():
     """Scrape the ONS NEET dataset page for the .xlsx download link and fetch it."""
     dataset_url = "https://www.ons.gov.uk/employmentandlabourmarket/peoplenotinwork/unemployment/datasets/youngpeoplenotineducationemploymentortrainingneettable1"
-    resp = requests.get(dataset_url, timeout=30)
+    resp = http_session.get(dataset_url, timeout=30)
     resp.raise_for_status()
     match = re.search(r'href="(/file\?uri=[^"]*\.xlsx[^"]*)"', resp.text, re.IGNORECASE)
     if not match:
         raise RuntimeError("Could not find xlsx download link on ONS NEET dataset page")
     xlsx_url = "https://www.ons.gov.uk" + match.group(1)
     print(f"  Downloading NEET xlsx from {xlsx_url}")
-    xlsx_resp = requests.get(xlsx_url, timeout=60)
+    xlsx_resp = http_session.get(xlsx_url, timeout=60)
     xlsx_resp.raise_for_status()
     tmp = tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False)
     tmp.write(xlsx_resp.content)
@@ -265,7 +334,7 @@ def _parse_neet_xlsx(path):
     wb.close()
     return results
 
-def fetch_neet_data():
+def fetch_neet_data(now=None):
     """
     Fetch NEET rate (16-24) from ONS NEET dataset (Excel).
     Downloads the latest xlsx, parses the seasonally-adjusted People sheet,
@@ -282,17 +351,14 @@ def fetch_neet_data():
             return None
         latest = entries[-1]
         print(f"  Latest NEET: {latest['period']} = {latest['value']}%")
-        return {
+        return _education_metric({
             "metric_name": "NEET Rate (16-24)",
             "metric_key": "neet_rate",
-            "category": "Education",
             "value": latest["value"],
-            "rag_status": calculate_rag_status("neet_rate", latest["value"]),
             "time_period": latest["period"],
             "data_source": "ONS: Young People NEET",
             "source_url": dataset_page,
-            "last_updated": datetime.now().isoformat(),
-        }
+        }, now=now)
     except Exception as e:
         print(f"  NEET fetch error: {e}")
         return None
@@ -300,57 +366,71 @@ def fetch_neet_data():
         if xlsx_path and os.path.exists(xlsx_path):
             os.unlink(xlsx_path)
 
-def fetch_persistent_absence_data():
+def fetch_persistent_absence_data(now=None):
     """
     Fetch Persistent Absence (% pupils missing 10%+ of school days) from DfE Pupil Absence.
     Data source: DfE: Pupil Absence - explore-education-statistics.
     """
     url = "https://explore-education-statistics.service.gov.uk/data-catalogue/data-set/01813f0b-fbbd-4e58-9bb6-4abd18d8a944/csv"
+    cached = load_metric("persistent_absence", max_age_hours=FRESH_HOURS)
+    if cached:
+        print(f"Persistent absence: reusing result saved within {FRESH_HOURS:g}h")
+        return {**cached, "last_updated": (now or datetime.now()).isoformat()}
     try:
         print("\\nFetching Persistent Absence (DfE Pupil Absence)...")
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        df = pd.read_csv(io.BytesIO(response.content))
-        national = df[df["geographic_level"] == "National"]
-        if national.empty:
-            return None
-        if "education_phase" in national.columns:
-            total_phase = national[national["education_phase"] == "Total"]
-            subset = total_phase if not total_phase.empty else national
-        else:
-            subset = national
-        latest_period = subset["time_period"].max()
-        latest = subset[subset["time_period"] == latest_period]
-        if latest.empty or "enrolments_pa_10_exact_percent" not in latest.columns:
+        path = cached_download(http_session, url, 30, max_age=DFE_CSV_MAX_AGE_SECONDS)
+        # One number is needed, so stream the rows rather than building a
+        # DataFrame: keep the first National row of the latest period, both for
+        # the "Total" education phase and overall (used when there is no Total).
+        # time_period is a six-digit code such as 202324, so string order is year order.
+        latest = latest_total = None
+        for row in _iter_csv_rows(path):
+            if row["geographic_level"] != "National":
+                continue
+            period = row["time_period"]
+            if latest is None or period > latest["time_period"]:
+                latest = row
+            if row.get("education_phase") == "Total" and (
+                latest_total is None or period > latest_total["time_period"]
+            ):
+                latest_total = row
+        latest = latest_total or latest
+        # A missing column and a blank cell both mean there is no figure.
+        if latest is None or not latest.get("enrolments_pa_10_exact_percent"):
             return None
-        value = float(latest["enrolments_pa_10_exact_percent"].iloc[0])
-        rag_status = calculate_rag_status("persistent_absence", value)
-        return {
+        latest_period = latest["time_period"]
+        value = float(latest["enrolments_pa_10_exact_percent"])
+        result = _education_metric({
             "metric_name": "Persistent Absence",
             "metric_key": "persistent_absence",
-            "category": "Education",
             "value": round(value, 2),
-            "rag_status": rag_status,
             "time_period": str(latest_period),
             "data_source": "DfE: Pupil Absence",
             "source_url": "https://explore-education-statistics.service.gov.uk/find-statistics/pupil-absence-in-schools-in-england",
-            "last_updated": datetime.now().isoformat(),
-        }
+        }, now=now, rag_value=value)
+        save_metric(result)
+        return result
     except Exception as e:
         print(f"  Error fetching persistent absence: {e}")
         return None
 
-def fetch_apprentice_starts_data():
+def fetch_apprentice_starts_data(now=None):
     """
     Fetch Apprentice Starts (total for latest academic year) from DfE Apprenticeships & Training.
     Data source: DfE: Apprenticeships & Training - explore-education-statistics.
     """
     url = "https://explore-education-statistics.service.gov.uk/data-catalogue/data-set/693cfe5f-bd05-4fc0-af9c-d62ac61d00be/csv"
+    cached = load_metric("apprentice_starts", max_age_hours=FRESH_HOURS)
+    if cached:
+        print(f"Apprentice starts: reusing result saved within {FRESH_HOURS:g}h")
+        return {**cached, "last_updated": (now or datetime.now()).isoformat()}
     try:
         print("\\nFetching Apprentice Starts (DfE Apprenticeships)...")
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        df = pd.read_csv(io.BytesIO(response.content))
+        df = _download_dfe_csv(
+            url,
+            usecols=lambda column: column in APPRENTICE_STARTS_COLUMNS,
+            dtype=DFE_CATEGORY_DTYPES,
+        )
         national = df[df["geographic_level"] == "National"]
         if national.empty or "starts" not in national.columns:
             return None
@@ -367,25 +447,24 @@ def fetch_apprentice_starts_data():
             raw = grand_total.iloc[0]["starts"]
             total_starts = int(raw) if str(raw).isdigit() else 0
         else:
-            total_starts = latest["starts"].replace("low", 0).apply(lambda x: int(x) if str(x).isdigit() else 0).sum()
+            # Suppressed counts ("low", "c", "x", ...) count as zero.
+            total_starts = pd.to_numeric(latest["starts"], errors="coerce").fillna(0).astype("int64").sum()
         value = int(total_starts)
-        rag_status = calculate_rag_status("apprentice_starts", value)
-        return {
+        result = _education_metric({
             "metric_name": "Apprentice Starts",
             "metric_key": "apprentice_starts",
-            "category": "Education",
             "value": value,
-            "rag_status": rag_status,
             "time_period": str(latest_period),
             "data_source": "DfE: Apprenticeships & Training",
             "source_url": "https://explore-education-statistics.service.gov.uk/find-statistics/apprenticeships",
-            "last_updated": datetime.now().isoformat(),
-        }
+        }, now=now)
+        save_metric(result)
+        return result
     except Exception as e:
         print(f"  Error fetching apprentice starts: {e}")
         return None
 
-def fetch_pupil_attendance_data():
+def fetch_pupil_attendance_data(now=None):
     """
     Fetch Unauthorised Pupil Absence rate from DfE: Pupil Absence in Schools.
     Scrapes the headline figure from the publication page.
@@ -393,7 +472,7 @@ def fetch_pupil_attendance_data():
     url = "https://explore-education-statistics.service.gov.uk/find-statistics/pupil-absence-in-schools-in-england"
     try:
         print("\nFetching Unauthorised Pupil Absence (DfE)...")
-        response = requests.get(url, timeout=30, headers={"User-Agent": "Mozilla/5.0"})
+        response = http_session.get(url, timeout=30, headers={"User-Agent": "Mozilla/5.0"})
         response.raise_for_status()
         text = response.text
 
@@ -414,18 +493,14 @@ def fetch_pupil_attendance_data():
         year_match = re.search(r'Academic year (\d{4}/\d{2})', text)
         time_period = year_match.group(1) if year_match else "unknown"
 
-        rag_status = calculate_rag_status("pupil_attendance", value)
-        return {
+        return _education_metric({
             "metric_name": "Unauthorised Pupil Absence",
             "metric_key": "pupil_attendance",
-            "category": "Education",
             "value": value,
-            "rag_status": rag_status,
             "time_period": time_period,
             "data_source": "DfE: Pupil Absence in Schools",
             "source_url": url,
-            "last_updated": datetime.now().isoformat(),
-        }
+        }, now=now)
     except Exception as e:
         print(f"  Error fetching pupil attendance: {e}")
         return None
@@ -590,7 +665,7 @@ def _format_quality_components(components):
     return "\n".join(lines)
 
 
-def fetch_university_education_quality_data():
+def fetch_university_education_quality_data(now=None):
     """
     Compute and return the Quality of University Education metric.
 
@@ -623,10 +698,9 @@ def fetch_university_education_quality_data():
             )
 
         score = compute_university_education_quality(components)
-        rag = calculate_rag_status("university_education_quality", score)
 
         # Label as the current calendar quarter — consistent with other metrics.
-        now = datetime.now()
+        now = now or datetime.now()
         quarter = (now.month - 1) // 3 + 1
         time_period = f"{now.year} Q{quarter}"
 
@@ -645,22 +719,19 @@ def fetch_university_education_quality_data():
                 f"(each 0.30)."
             )
 
-        metric = {
+        metric = _education_metric({
             "metric_name": "Quality of University Education",
             "metric_key": "university_education_quality",
-            "category": "Education",
             "value": score,
-            "rag_status": rag,
             "time_period": time_period,
             "data_source": data_source_label,
             "source_url": "https://www.hesa.ac.uk/data-and-analysis/graduates/releases",
-            "last_updated": datetime.now().isoformat(),
             "information": information,
             "unit": "%",
-        }
+        }, now=now)
         print(
             f"[Education]   University Education Quality: "
-            f"{score:.1f}% ({rag.upper()})"
+            f"{score:.1f}% ({metric['rag_status'].upper()})"
         )
         return metric
     except Exception as e:
@@ -670,48 +741,44 @@ def fetch_university_education_quality_data():
 
 def fetch_all_education_metrics():
     """Fetch all education metrics"""
-    metrics = []
-    
-    # Fetch Attainment 8
-    attainment8 = fetch_attainment8_data()
-    if attainment8:
-        metrics.append(attainment8)
-    
-    # Fetch Teacher Vacancies (placeholder)
-    teacher_vacancy = fetch_teacher_vacancy_data()
-    if teacher_vacancy:
-        metrics.append(teacher_vacancy)
-    
-    # Fetch NEET (placeholder)
-    neet = fetch_neet_data()
-    if neet:
-        metrics.append(neet)
-    
-    # Fetch Persistent Absence (DfE: Pupil Absence)
-    persistent_absence = fetch_persistent_absence_data()
-    if persistent_absence:
-        metrics.append(persistent_absence)
-    
-    # Fetch Apprentice Starts (DfE: Apprenticeships & Training)
-    apprentice_starts = fetch_apprentice_starts_data()
-    if apprentice_starts:
-        metrics.append(apprentice_starts)
-
-    # Fetch Unauthorised Pupil Absence (DfE: Pupil Absence in Schools)
-    pupil_attendance = fetch_pupil_attendance_data()
-    if pupil_attendance:
-        metrics.append(pupil_attendance)
-
-    # Quality of University Education (composite of HESA Graduate Outcomes,
-    # HESA Student data continuation, OfS NSS) — sourced from the
-    # education_quality_components collection, with hardcoded fallback.
-    uni_quality = fetch_university_education_quality_data()
-    if uni_quality:
-        metrics.append(uni_quality)
-
-    return metrics
+    fetchers = [
+        fetch_attainment8_data,
+        # Teacher Vacancies (placeholder)
+        fetch_teacher_vacancy_data,
+        fetch_neet_data,
+        # Persistent Absence (DfE: Pupil Absence)
+        fetch_persistent_absence_data,
+        # Apprentice Starts (DfE: Apprenticeships & Training)
+        fetch_apprentice_starts_data,
+        # Unauthorised Pupil Absence (DfE: Pupil Absence in Schools)
+        fetch_pupil_attendance_data,
+        # Quality of University Education (composite of HESA Graduate Outcomes,
+        # HESA Student data continuation, OfS NSS) — sourced from the
+        # education_quality_components collection, with hardcoded fallback.
+        fetch_university_education_quality_data,
+    ]
+    # Each fetcher waits on its own DfE / ONS download (or Mongo) and catches its
+    # own errors, so run them in threads: the refresh takes as long as the slowest
+    # source rather than the sum. Results keep the order above.
+    # One timestamp for the whole run, so every metric carries the same
+    # last_updated.
+    now = datetime.now()
+    with ThreadPoolExecutor(max_workers=len(fetchers)) as pool:
+        results = list(pool.map(lambda fetch: fetch(now), fetchers))
+    return [metric for metric in results if metric]
+
+
+def _dumps_metrics(metrics):
+    """Serialise the metric rows as an indented JSON array (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(metrics, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(metrics, indent=2)
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
     print("=" * 60)
     print("UK RAG Dashboard - Education Data Fetcher")
     print("=" * 60)
@@ -733,4 +800,4 @@ if __name__ == "__main__":
     print("\\n" + "=" * 60)
     print("JSON Output")
     print("=" * 60)
-    print(json.dumps(metrics, indent=2))
+    print(_dumps_metrics(metrics))
@@ -0,0 +1,162 @@
+"""
+On-disk HTTP download cache with conditional-GET revalidation.
+
+The fetchers pull the same ONS / GOV.UK workbooks on every run even though most are
+only republished quarterly. Each body is stored on disk next to its ETag and
+Last-Modified validators; later downloads send If-None-Match / If-Modified-Since, so an
+unchanged file costs a single 304 round-trip instead of a multi-MB transfer.
+
+Callers may also pass max_age: a body fetched (or revalidated) less than that many
+seconds ago is returned without contacting the server at all.
+
+cached_parse additionally memoizes what a fetcher parsed out of a cached body, keyed by
+the body's content hash, so re-running against unchanged files skips the parse too.
+
+Set HTTP_CACHE_DIR to move the cache (defaults to server/.http_cache).
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import requests
+
+CACHE_DIR = os.environ.get("HTTP_CACHE_DIR") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), ".http_cache"
+)
+CHUNK_SIZE = 64 * 1024
+
+
+def _cache_paths(url: str, cache_dir: str) -> Tuple[str, str]:
+    """Return (body_path, meta_path) for a URL.
+
+    The body keeps the URL's file extension because openpyxl refuses paths without one.
+    """
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    ext = os.path.splitext(url)[1].lower()
+    if not re.fullmatch(r"\.[a-z0-9]{1,5}", ext):
+        ext = ".body"
+    return os.path.join(cache_dir, key + ext), os.path.join(cache_dir, key + ".json")
+
+
+def _read_meta(meta_path: str) -> Dict[str, Any]:
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_meta(meta_path: str, meta: Dict[str, Any]) -> None:
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+
+
+def _writable_dir(cache_dir: str) -> str:
+    """Use cache_dir if it can be created, otherwise fall back to the system temp dir."""
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        return cache_dir
+    except OSError as e:
+        print(f"[HttpCache] Cache dir {cache_dir} unavailable ({e}); using temp dir", file=sys.stderr)
+        return tempfile.gettempdir()
+
+
+def cached_download(
+    session: requests.Session,
+    url: str,
+    timeout: float,
+    cache_dir: Optional[str] = None,
+    max_age: float = 0,
+) -> str:
+    """
+    Download url to the cache and return the local file path.
+
+    A cached copy checked less than max_age seconds ago is returned as is. Otherwise it
+    is revalidated with its stored validators; on 304 the cached file is returned
+    untouched (and counts as checked now). New bodies are streamed to a temp file and atomically renamed
+    into place, so concurrent fetchers never observe a partial file.
+    """
+    cache_dir = _writable_dir(cache_dir or CACHE_DIR)
+    body_path, meta_path = _cache_paths(url, cache_dir)
+    meta = _read_meta(meta_path) if os.path.exists(body_path) else {}
+    if meta and max_age and time.time() - meta.get("checked_at", 0) < max_age:
+        return body_path
+
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+
+    with session.get(url, timeout=timeout, stream=True, headers=headers) as response:
+        if response.status_code == 304 and meta:
+            _write_meta(meta_path, {**meta, "checked_at": time.time()})
+            return body_path
+        response.raise_for_status()
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    out.write(chunk)
+            os.replace(tmp_path, body_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        validators = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "checked_at": time.time(),
+        }
+
+    _write_meta(meta_path, validators)
+    return body_path
+
+
+def _file_sha1(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cached_parse(body_path: str, parse: Callable[[str], Any], version: str) -> Any:
+    """
+    Return parse(body_path), memoized on disk against the body's content hash.
+
+    The result (which must be JSON-serialisable) is stored beside the body together
+    with the SHA-1 of the bytes it was parsed from and the caller's version tag; bump
+    the tag whenever the parser's output changes. A memo that is missing, stale or
+    unreadable is simply re-parsed, and a failure to store it only logs.
+    """
+    memo_path = body_path + ".parsed.json"
+    key = f"{version}:{_file_sha1(body_path)}"
+    try:
+        with open(memo_path, encoding="utf-8") as f:
+            memo = json.load(f)
+        if memo["key"] == key:
+            return memo["value"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    value = parse(body_path)
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(memo_path), suffix=".part")
+    except OSError as e:
+        print(f"[HttpCache] Could not store parsed {body_path}: {e}", file=sys.stderr)
+        return value
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "value": value}, f)
+        os.replace(tmp_path, memo_path)
+    except (OSError, TypeError, ValueError) as e:
+        os.unlink(tmp_path)
+        print(f"[HttpCache] Could not store parsed {body_path}: {e}", file=sys.stderr)
+    return value
@@ -0,0 +1,70 @@
+"""
+Last-known-good cache for parsed dashboard metrics.
+
+Several fetchers download a multi-MB workbook just to read one number. Each
+successfully parsed metric is stored here; a fresh entry lets the next run skip
+the download entirely, and an entry of any age is served when the source is
+unreachable or unparseable, ahead of any built-in estimate.
+
+Set METRIC_CACHE_DIR to move the cache (defaults to server/.metric_cache) and
+METRIC_CACHE_FRESH_HOURS to change how long an entry short-circuits the
+download (0 always re-fetches).
+"""
+
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from typing import Any, Dict, Optional
+
+CACHE_DIR = os.environ.get("METRIC_CACHE_DIR") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), ".metric_cache"
+)
+FRESH_HOURS = float(os.environ.get("METRIC_CACHE_FRESH_HOURS", "6"))
+
+
+def _cache_path(metric_key: str, cache_dir: str) -> str:
+    return os.path.join(cache_dir, re.sub(r"[^\w.-]", "_", metric_key) + ".json")
+
+
+def load_metric(
+    metric_key: str,
+    max_age_hours: Optional[float] = None,
+    cache_dir: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Return the last metric saved for metric_key, or None.
+
+    With max_age_hours, entries saved longer ago than that (or any entry, when it
+    is 0) are ignored; without it, an entry of any age is returned.
+    """
+    path = _cache_path(metric_key, cache_dir or CACHE_DIR)
+    try:
+        with open(path, encoding="utf-8") as f:
+            entry = json.load(f)
+        metric, saved_at = entry["metric"], float(entry["saved_at"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if max_age_hours is not None and time.time() - saved_at >= max_age_hours * 3600:
+        return None
+    return metric
+
+
+def save_metric(metric: Dict[str, Any], cache_dir: Optional[str] = None) -> None:
+    """Store a freshly parsed metric under its metric_key. Never raises."""
+    cache_dir = cache_dir or CACHE_DIR
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".part")
+    except OSError as e:
+        print(f"[MetricCache] Cache dir {cache_dir} unavailable ({e})", file=sys.stderr)
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"saved_at": time.time(), "metric": metric}, f)
+        os.replace(tmp_path, _cache_path(metric["metric_key"], cache_dir))
+    except (OSError, KeyError, TypeError, ValueError) as e:
+        os.unlink(tmp_path)
+        print(f"[MetricCache] Could not save {metric.get('metric_key')}: {e}", file=sys.stderr)
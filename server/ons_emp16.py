@@ -8,8 +8,8 @@ edition page and parsing the "Latest version" link, so automation does not rely
 
 import re
 import sys
-from typing import Dict, List, Optional, Tuple
-from io import BytesIO
+from tempfile import SpooledTemporaryFile
+from typing import IO, Dict, List, Optional, Tuple
 
 import requests
 
@@ -20,6 +20,10 @@ EMP16_CURRENT_EDITION_PAGE = (
     "employmentandemployeetypes/datasets/underemploymentandoveremploymentemp16/current"
 )
 
+# The workbook is spooled in memory up to this size, then spills to a temp file.
+SPOOL_MAX_BYTES = 16 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
 
 def get_latest_emp16_xls_url(session: Optional[requests.Session] = None) -> Optional[str]:
     """
@@ -53,6 +57,26 @@ def get_latest_emp16_xls_url(session: Optional[requests.Session] = None) -> Opti
     return None
 
 
+def _download_xls(session: requests.Session, url: str, timeout: float = 60) -> IO[bytes]:
+    """
+    Stream url into a spooled temp file and return it rewound, ready for pandas.
+
+    Chunks are written as they arrive, so the body is never held as one bytes object
+    alongside a BytesIO copy of it. The caller closes the returned file.
+    """
+    with session.get(url, timeout=timeout, stream=True) as r:
+        r.raise_for_status()
+        tmp = SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+        try:
+            for chunk in r.iter_content(chunk_size=CHUNK_SIZE):
+                tmp.write(chunk)
+        except BaseException:
+            tmp.close()
+            raise
+    tmp.seek(0)
+    return tmp
+
+
 def _parse_quarter_label(label: str) -> Optional[Tuple[int, int]]:
     """Parse 'Jan-Mar 2002' or 'Apr-Jun 2002' -> (year, quarter)."""
     if not label or " " not in label:
@@ -95,10 +119,8 @@ def fetch_emp16_underemployment_level_by_quarter(
     if not url:
         return {}
     try:
-        r = sess.get(url, timeout=60)
-        r.raise_for_status()
-        content = BytesIO(r.content)
-        df = pd.read_excel(content, sheet_name="Levels", header=None)
+        with _download_xls(sess, url) as content:
+            df = pd.read_excel(content, sheet_name="Levels", header=None)
     except Exception as e:
         print(f"[OnsEmp16] Error loading EMP16 Excel: {e}", file=sys.stderr)
         return {}
@@ -139,22 +161,30 @@ def fetch_emp16_underemployment_rate_by_quarter(
     if not url:
         return []
     try:
-        r = sess.get(url, timeout=60)
-        r.raise_for_status()
-        content = BytesIO(r.content)
-        excel_file = pd.ExcelFile(content)
+        content = _download_xls(sess, url)
     except Exception as e:
         print(f"[OnsEmp16] Error loading EMP16 Excel for inactivity: {e}", file=sys.stderr)
         return []
+    with content:
+        try:
+            excel_file = pd.ExcelFile(content)
+        except Exception as e:
+            print(f"[OnsEmp16] Error loading EMP16 Excel for inactivity: {e}", file=sys.stderr)
+            return []
+        with excel_file:
+            return _rate_series(excel_file)
+
 
+def _rate_series(excel_file) -> List[Dict]:
+    """Parse the underemployment rate series from the first candidate sheet that has one."""
+    import pandas as pd
     cand_sheets = [n for n in excel_file.sheet_names if n and "rate" in n.lower()]
     if not cand_sheets:
         cand_sheets = list(excel_file.sheet_names) if excel_file.sheet_names else []
 
     for sheet_name in cand_sheets:
         try:
-            df = pd.read_excel(content, sheet_name=sheet_name, header=None)
-            content.seek(0)
+            df = pd.read_excel(excel_file, sheet_name=sheet_name, header=None)
         except Exception as e:
             print(f"[OnsEmp16] Error parsing sheet {sheet_name}: {e}", file=sys.stderr)
             continue
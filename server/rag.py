@@ -0,0 +1,71 @@
+"""
+Shared RAG (red / amber / green) classification for the fetchers.
+
+Each fetcher keeps its own RAG_THRESHOLDS dict (the per-metric green/amber cut-offs)
+and builds a signed table from it once at import. Scaling every threshold by +1 or -1
+turns lower-is-better metrics into higher-is-better ones, so a single pair of
+comparisons classifies any metric.
+"""
+
+from typing import Dict, Iterable, List, Mapping, Tuple
+
+import numpy as np
+
+SignedTable = Dict[str, Tuple[float, float, float]]
+
+# Index with the number of thresholds a value clears (0, 1 or 2).
+_LABELS = np.array(["red", "amber", "green"])
+
+
+def signed_table(
+    thresholds: Mapping[str, Mapping[str, float]],
+    higher_is_better: Iterable[str],
+    strict_lower: bool = False,
+) -> SignedTable:
+    """Map each metric_key to (sign, sign * green, sign * amber).
+
+    Keys listed in higher_is_better get sign +1; every other key is lower-is-better.
+    Lower-is-better bounds are inclusive (value <= green is green) unless strict_lower
+    is set, in which case a value must be strictly below a threshold to clear it; each
+    such threshold is moved one float down, so the comparisons stay the same.
+    """
+    higher_is_better = set(higher_is_better)
+    table = {}
+    for key, t in thresholds.items():
+        if key in higher_is_better:
+            table[key] = (1.0, float(t["green"]), float(t["amber"]))
+            continue
+        green, amber = float(t["green"]), float(t["amber"])
+        if strict_lower:
+            green, amber = np.nextafter(green, -np.inf), np.nextafter(amber, -np.inf)
+        table[key] = (-1.0, -float(green), -float(amber))
+    return table
+
+
+def rag_status(table: SignedTable, metric_key: str, value: float) -> str:
+    """Classify one value (returns lowercase). Unknown metrics are amber."""
+    entry = table.get(metric_key)
+    if entry is None:
+        return "amber"
+    sign, green, amber = entry
+    signed = sign * value
+    if signed >= green:
+        return "green"
+    if signed >= amber:
+        return "amber"
+    return "red"
+
+
+def rag_statuses(table: SignedTable, metric_key: str, values) -> List[str]:
+    """Vectorised rag_status for a sequence of values (returns a list).
+
+    Branchless: each value is scored as an int code, mapped to a label once at the end.
+    """
+    values = np.asarray(values, dtype=float)
+    entry = table.get(metric_key)
+    if entry is None:
+        return ["amber"] * len(values)
+    sign, green, amber = entry
+    signed = sign * values
+    codes = (signed >= amber).astype(np.intp) + (signed >= green)
+    return _LABELS[codes].tolist()
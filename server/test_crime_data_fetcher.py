@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the crime fetcher's pure helpers (crime_data_fetcher.py).
+
+Covers RAG classification (scalar and vectorised), the numeric cell scan, the
+Table B7 period parser and Table B7 row selection — no network, no MongoDB.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import crime_data_fetcher as fetcher  # noqa: E402
+
+
+class TestCalculateRagStatus(unittest.TestCase):
+    def test_lower_is_better_metrics(self):
+        self.assertEqual(fetcher.calculate_rag_status("recorded_crime_rate", 80.0), "green")
+        self.assertEqual(fetcher.calculate_rag_status("recorded_crime_rate", 95.0), "amber")
+        self.assertEqual(fetcher.calculate_rag_status("recorded_crime_rate", 100.1), "red")
+        self.assertEqual(fetcher.calculate_rag_status("street_confidence_index", 21.6), "amber")
+        self.assertEqual(fetcher.calculate_rag_status("crown_court_backlog", 107.4), "red")
+        self.assertEqual(fetcher.calculate_rag_status("recall_rate", 7.5), "green")
+
+    def test_charge_rate_is_higher_is_better(self):
+        self.assertEqual(fetcher.calculate_rag_status("charge_rate", 10.0), "green")
+        self.assertEqual(fetcher.calculate_rag_status("charge_rate", 7.0), "amber")
+        self.assertEqual(fetcher.calculate_rag_status("charge_rate", 6.9), "red")
+
+    def test_unknown_metric_is_amber(self):
+        self.assertEqual(fetcher.calculate_rag_status("not_a_metric", 1.0), "amber")
+
+    def test_vectorised_charge_rate_bounds(self):
+        self.assertEqual(fetcher.calculate_rag_statuses("charge_rate", [10.0, 7.0, 6.9]), ["green", "amber", "red"])
+
+
+class TestQuarterLabel(unittest.TestCase):
+    def test_months_map_to_quarters(self):
+        self.assertEqual(fetcher._quarter_label(datetime(2025, 1, 31)), "2025 Q1")
+        self.assertEqual(fetcher._quarter_label(datetime(2025, 6, 1)), "2025 Q2")
+        self.assertEqual(fetcher._quarter_label(datetime(2025, 12, 31)), "2025 Q4")
+
+
+class TestCoerceNumeric(unittest.TestCase):
+    def test_strips_thousands_separators_and_percent_signs(self):
+        np.testing.assert_array_equal(
+            fetcher._coerce_numeric(["7.3%", "74,651", 88.7]), [7.3, 74651.0, 88.7]
+        )
+
+    def test_non_numeric_cells_become_nan_and_shape_is_kept(self):
+        out = fetcher._coerce_numeric(np.array([["n/a", None], [np.nan, "12"]], dtype=object))
+        self.assertEqual(out.shape, (2, 2))
+        self.assertTrue(np.isnan(out[0, 0]) and np.isnan(out[0, 1]) and np.isnan(out[1, 0]))
+        self.assertEqual(out[1, 1], 12.0)
+
+    def test_numbers_are_taken_as_is_and_other_objects_are_nan(self):
+        out = fetcher._coerce_numeric([912.7555772777216, 3, True, datetime(2024, 3, 31)])
+        self.assertEqual(out[0], 912.7555772777216)
+        self.assertEqual(out[1], 3.0)
+        self.assertTrue(np.isnan(out[2]) and np.isnan(out[3]))
+
+
+class TestFindInMatchingRows(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame([
+            ["Table P1", None, None],
+            ["Wales", 1000, 200.0],
+            ["Crime total", "6,700,000", None],
+            ["England and Wales", "6,650,000", 88.7],
+        ])
+
+    def test_row_strings_drop_blank_cells_and_lowercase(self):
+        self.assertEqual(self.df.pipe(fetcher._row_strings).str.split().tolist()[0], ["table", "p1"])
+
+    def test_skips_matching_rows_without_an_in_range_value(self):
+        value, row = fetcher._find_in_matching_rows(self.df, fetcher.RECORDED_CRIME_ROW_RE, 50, 150)
+        self.assertEqual((value, row), (88.7, 3))
+
+    def test_first_hit_is_row_major_across_candidate_rows(self):
+        df = pd.DataFrame([["England", 120.0, 88.7], ["England", 60.0, None]])
+        self.assertEqual(
+            fetcher._find_in_matching_rows(df, fetcher.RECORDED_CRIME_ROW_RE, 50, 150), (120.0, 0)
+        )
+
+    def test_no_match(self):
+        self.assertEqual(
+            fetcher._find_in_matching_rows(self.df, fetcher.CROWN_BACKLOG_ROW_RE, 30000, 100000),
+            (None, None),
+        )
+
+
+class TestLastRowFirstMatch(unittest.TestCase):
+    def test_later_row_wins_and_first_cell_in_that_row(self):
+        df = pd.DataFrame([["Year ending Dec 2023", None], [7.3, "Year ending March 2025"], [None, "n/a"]])
+        self.assertEqual(
+            fetcher._last_row_first_match(df, fetcher.CHARGE_PERIOD_RE, strings_only=True),
+            "Year ending March 2025",
+        )
+
+    def test_strings_only_skips_numeric_cells(self):
+        df = pd.DataFrame([[2024, None], [None, 1.5]])
+        self.assertIsNone(fetcher._last_row_first_match(df, fetcher.RECORDED_CRIME_PERIOD_RE, strings_only=True))
+        self.assertEqual(fetcher._last_row_first_match(df, fetcher.RECORDED_CRIME_PERIOD_RE), 2024)
+
+
+class TestChargeRateSheets(unittest.TestCase):
+    def test_prefers_outcome_like_sheet_names(self):
+        names = ["Cover_sheet", "Contents", "Notes", "Table_1_outcomes", "Charge_summary", "Table_9"]
+        self.assertEqual(
+            fetcher._charge_rate_sheets(names, 15), ["Table_1_outcomes", "Charge_summary"]
+        )
+
+    def test_falls_back_to_leading_sheets(self):
+        names = ["Sheet1", "Sheet2", "Sheet3"]
+        self.assertEqual(fetcher._charge_rate_sheets(names, 2), ["Sheet1", "Sheet2"])
+
+
+class TestParseB7Period(unittest.TestCase):
+    def test_year_ending_march_is_q1(self):
+        self.assertEqual(fetcher._parse_b7_period("Apr 2024 to Mar 2025"), "2025 Q1")
+
+    def test_calendar_year_is_q4(self):
+        self.assertEqual(fetcher._parse_b7_period("Jan 1994 to Dec 1994"), "1994 Q4")
+
+    def test_unrecognised_label_passes_through(self):
+        self.assertEqual(fetcher._parse_b7_period("2001/02"), "2001/02")
+
+
+class TestPerceptionOfSafety(unittest.TestCase):
+    def test_uses_last_sex_header_and_last_all_people_row(self):
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "Table B7"
+        periods = ["Apr 2022 to Mar 2023", "Apr 2023 to Mar 2024"]
+        for row in (
+            ["Table B7: Perception of safety"],
+            ["Sex", *periods],
+            ["All people", 70, 71],
+            ["Men", 80, 81],
+            ["Sex", *periods],
+            ["All people", 60, 62],
+        ):
+            ws.append(row)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "b7.xlsx")
+            wb.save(path)
+            with mock.patch.object(fetcher, "_download", return_value=path):
+                rows = fetcher.fetch_perception_of_safety_data(datetime(2025, 6, 1))
+        self.assertEqual(
+            [(r["time_period"], r["value"]) for r in rows],
+            [("2023 Q1", 40.0), ("2024 Q1", 38.0)],
+        )
+
+
+class TestFreshMetricCache(unittest.TestCase):
+    def test_reused_rows_carry_the_run_timestamp(self):
+        saved = {"metric_key": "charge_rate", "value": 7.3, "last_updated": "2026-01-01T00:00:00"}
+        with mock.patch.object(fetcher, "load_metric", return_value=saved):
+            metric = fetcher.fetch_charge_rate_data(datetime(2026, 3, 1, 12, 0))
+        self.assertEqual(metric, {**saved, "last_updated": "2026-03-01T12:00:00"})
+
+
+if __name__ == "__main__":
+    unittest.main()
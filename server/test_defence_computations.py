@@ -4,16 +4,21 @@ from __future__ import annotations
 
 import sys
 import os
+import tempfile
 import unittest
 
 sys.path.insert(0, os.path.dirname(__file__))
 
 from defence_data_fetcher import (
+    _first_excel_link,
+    _latest_annual,
+    _personnel_columns,
     compute_sea_mass_score,
     compute_land_mass_score,
     compute_air_mass_score,
     compute_combined_sustainability_score,
     calculate_rag_status,
+    calculate_rag_statuses,
     get_sea_mass_information,
     get_land_mass_information,
     get_air_mass_information,
@@ -103,6 +108,58 @@ class TestRAGStatus(unittest.TestCase):
     def test_unknown_metric_returns_amber(self):
         self.assertEqual(calculate_rag_status("unknown_metric", 42.0), "amber")
 
+    def test_batch_defence_spending_bounds(self):
+        self.assertEqual(calculate_rag_statuses("defence_spending_gdp", [2.5, 2.0, 1.9]), ["green", "amber", "red"])
+
+
+class TestLatestAnnual(unittest.TestCase):
+    def _csv(self, text):
+        f = tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, encoding="utf-8")
+        f.write(text)
+        f.close()
+        self.addCleanup(os.unlink, f.name)
+        return f.name
+
+    def test_returns_last_annual_value_skipping_metadata_and_quarters(self):
+        path = self._csv(
+            '"Title","Defence, total"\n"CDID","KLYR"\n"Important notes","line one\nline two"\n'
+            '"2022","50,000"\n"2023","55,000"\n"2023 Q1","13,000"\n"2024 JAN","4,000"\n'
+        )
+        self.assertEqual(_latest_annual(path), 55000.0)
+
+    def test_no_annual_rows_returns_none(self):
+        self.assertIsNone(_latest_annual(self._csv('"Title","GDP"\n"2023 Q1","620,000"\n')))
+
+
+class TestFirstExcelLink(unittest.TestCase):
+    def test_prefers_xlsx_over_earlier_xls(self):
+        html = '<a href="/media/a/old.xls">o</a><a href="/media/b/tables.xlsx">t</a>'
+        self.assertEqual(_first_excel_link(html), "/media/b/tables.xlsx")
+
+    def test_falls_back_to_xls_then_none(self):
+        self.assertEqual(_first_excel_link('<a href="/media/a/old.xls">o</a>'), "/media/a/old.xls")
+        self.assertIsNone(_first_excel_link('<a href="/media/a/notes.pdf">n</a>'))
+
+    def test_single_quoted_and_attribute_order_variants(self):
+        html = "<a class='dl' href='/media/c/strength.xlsx?v=2'>s</a>"
+        self.assertEqual(_first_excel_link(html), "/media/c/strength.xlsx?v=2")
+
+
+class TestPersonnelColumns(unittest.TestCase):
+    def test_strength_and_target_columns(self):
+        header = ["Service", "Full-time trained strength", "Workforce target", "Notes"]
+        self.assertEqual(
+            _personnel_columns(header),
+            ("Full-time trained strength", "Workforce target", None),
+        )
+
+    def test_percentage_column_wins(self):
+        header = ["Service", "Strength", "Strength as % of target", "Target"]
+        self.assertEqual(_personnel_columns(header), ("Strength", None, "Strength as % of target"))
+
+    def test_no_matching_columns(self):
+        self.assertEqual(_personnel_columns(["Service", "Notes"]), (None, None, None))
+
 
 class TestSeaMassInformation(unittest.TestCase):
     def test_returns_string(self):
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the ONS economy fetcher's pure helpers (economy_data_fetcher.py).
+
+Covers RAG bands, the generator-CSV parser, the quarterly filter and sort, the YoY
+growth transform and the JSON writer — no network.
+"""
+from __future__ import annotations
+
+import io
+import json
+import os
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from economy_data_fetcher import ONSDataFetcher, _write_metrics  # noqa: E402
+
+ONS_CSV = (
+    b'"Title","Gross Domestic Product: chained volume measures \xa3m"\n'
+    b'"CDID","ABMI"\n'
+    b'"Source dataset ID","PN2"\n'
+    b'"Release date","12-09-2025"\n'
+    b'"Important notes","Revised, see\nrelease notes"\n'
+    b'"2023","2,000"\n'
+    b'"2024","2400.5"\n'
+    b'"2024 Q1",""\n'
+    b'"2024 Q2","601.25"\n'
+    b'"2024 JAN","200"\n'
+)
+
+
+class TestParseCsvRows(unittest.TestCase):
+    def test_skips_metadata_and_unparseable_values(self):
+        self.assertEqual(
+            ONSDataFetcher._parse_csv_rows(io.BytesIO(ONS_CSV)),
+            [
+                {"date": "2024", "value": 2400.5},
+                {"date": "2024 Q2", "value": 601.25},
+                {"date": "2024 JAN", "value": 200.0},
+            ],
+        )
+
+    def test_no_data_rows(self):
+        csv = io.BytesIO(b'"Title","GDP"\n"CDID","ABMI"\n')
+        self.assertEqual(ONSDataFetcher._parse_csv_rows(csv), [])
+
+    def test_keyed_quarters(self):
+        rows = ONSDataFetcher._parse_csv_rows(io.BytesIO(ONS_CSV))
+        self.assertEqual(ONSDataFetcher._keyed_quarters(rows), [((2024, 2), {"date": "2024 Q2", "value": 601.25})])
+
+    def test_keyed_quarters_sorts_stably(self):
+        rows = [
+            {"date": "2024 Q1", "value": 1.0},
+            {"date": "2023 Q4", "value": 2.0},
+            {"date": "2024 Q1", "value": 3.0},
+            {"date": "2023", "value": 4.0},
+        ]
+        self.assertEqual(
+            [(pq, r["value"]) for pq, r in ONSDataFetcher._keyed_quarters(rows)],
+            [((2023, 4), 2.0), ((2024, 1), 1.0), ((2024, 1), 3.0)],
+        )
+
+
+class TestFetchCsvRows(unittest.TestCase):
+    def test_concurrent_callers_share_one_download(self):
+        fetcher = ONSDataFetcher()
+        rows = [{"date": "2024 Q1", "value": 1.0}]
+        with mock.patch.object(fetcher, "_download_csv_rows", return_value=rows) as download:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                results = list(pool.map(lambda _: fetcher._fetch_csv_rows(fetcher.GDP_LEVEL_ABMI_URL, "GDP"), range(8)))
+        download.assert_called_once_with(fetcher.GDP_LEVEL_ABMI_URL, "GDP")
+        self.assertEqual(results, [rows] * 8)
+
+    def test_failed_download_is_retried(self):
+        fetcher = ONSDataFetcher()
+        rows = [{"date": "2024 Q1", "value": 1.0}]
+        with mock.patch.object(fetcher, "_download_csv_rows", side_effect=[None, rows]) as download:
+            self.assertIsNone(fetcher._fetch_csv_rows(fetcher.GDP_LEVEL_ABMI_URL, "GDP"))
+            self.assertEqual(fetcher._fetch_csv_rows(fetcher.GDP_LEVEL_ABMI_URL, "GDP"), rows)
+        self.assertEqual(download.call_count, 2)
+
+
+class TestFetchAllEconomyMetrics(unittest.TestCase):
+    def test_unexpected_error_loses_only_that_series(self):
+        fetcher = ONSDataFetcher()
+        metric = {"metric_key": "cpi_inflation", "value": 3.8}
+
+        def fetch(key, historical=False):
+            if key == "cpi_inflation":
+                return metric
+            raise TypeError(key)
+
+        with mock.patch.object(fetcher, "fetch_csv_series", side_effect=fetch), \
+                mock.patch.object(fetcher, "fetch_business_investment_pct", return_value=None), \
+                self.assertLogs("economy_data_fetcher", "ERROR"):
+            results = fetcher.fetch_all_economy_metrics()
+        self.assertEqual(results["cpi_inflation"], metric)
+        self.assertEqual({key for key, value in results.items() if value is not None}, {"cpi_inflation"})
+
+
+class TestCalculateRagStatus(unittest.TestCase):
+    BOUNDARIES = {
+        "output_per_hour": [(0.5, "red"), (0.51, "amber"), (1.5, "amber"), (1.51, "green")],
+        "cpi_inflation": [
+            (-0.1, "red"), (0.0, "amber"), (1.49, "amber"), (1.5, "green"),
+            (2.5, "green"), (2.6, "amber"), (4.0, "amber"), (4.1, "red"),
+        ],
+        "real_gdp_growth": [(0.99, "red"), (1.0, "amber"), (2.0, "green")],
+        "public_sector_net_debt": [(70, "green"), (85, "amber"), (85.1, "red")],
+        "business_investment": [(9.9, "red"), (10, "amber"), (12, "amber"), (12.1, "green")],
+    }
+
+    def test_band_boundaries(self):
+        fetcher = ONSDataFetcher()
+        for key, cases in self.BOUNDARIES.items():
+            for value, expected in cases:
+                self.assertEqual(fetcher.calculate_rag_status(key, value), expected, (key, value))
+
+    def test_unknown_metric_is_amber(self):
+        self.assertEqual(ONSDataFetcher().calculate_rag_status("not_a_metric", 1.0), "amber")
+        self.assertEqual(ONSDataFetcher().calculate_rag_statuses("not_a_metric", [1.0, 2.0]), ["amber", "amber"])
+
+    def test_vectorised_matches_scalar(self):
+        fetcher = ONSDataFetcher()
+        values = [-1.0, 0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 4.0, 10.0, 12.0, 70.0, 85.0, 90.0, float("nan")]
+        for key in self.BOUNDARIES:
+            self.assertEqual(
+                fetcher.calculate_rag_statuses(key, values),
+                [fetcher.calculate_rag_status(key, v) for v in values],
+                key,
+            )
+
+
+class TestLevelsToYoyGrowth(unittest.TestCase):
+    def test_same_quarter_previous_year_sorted_and_gap_safe(self):
+        rows = [
+            {"date": "2024 Q2", "value": 110.0},
+            {"date": "2023 Q1", "value": 100.0},
+            {"date": "2023 Q2", "value": 100.0},
+            {"date": "2024", "value": 400.0},
+            {"date": "2024 Q1", "value": 99.0},
+            {"date": "2025 Q1", "value": 102.0},
+        ]
+        self.assertEqual(
+            ONSDataFetcher._levels_to_yoy_growth(rows),
+            [
+                {"date": "2024 Q1", "value": -1.0},
+                {"date": "2024 Q2", "value": 10.0},
+                {"date": "2025 Q1", "value": 3.03},
+            ],
+        )
+
+    def test_zero_base_and_no_quarters_are_skipped(self):
+        rows = [{"date": "2023 Q1", "value": 0.0}, {"date": "2024 Q1", "value": 5.0}]
+        self.assertEqual(ONSDataFetcher._levels_to_yoy_growth(rows), [])
+        self.assertEqual(ONSDataFetcher._levels_to_yoy_growth([{"date": "2024", "value": 1.0}]), [])
+
+
+class TestWriteMetrics(unittest.TestCase):
+    def _write(self, metrics):
+        out = io.StringIO()
+        count = _write_metrics(out, iter(metrics))
+        return out.getvalue(), count
+
+    def test_matches_stdlib_json(self):
+        metrics = [
+            {"metric_key": "cpi_inflation", "value": 3.8, "time_period": "2025 AUG"},
+            {"metric_key": "energy_prices", "value": 1738.0, "unit": "GBP/year", "note": "a\nb"},
+        ]
+        text, count = self._write(metrics)
+        self.assertEqual(count, 2)
+        self.assertEqual(json.loads(text), metrics)
+        self.assertEqual(text, json.dumps(metrics, indent=2))
+
+    def test_empty(self):
+        self.assertEqual(self._write([]), ("[]", 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
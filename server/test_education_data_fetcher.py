@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the DfE / ONS education fetcher's CSV and row helpers
+(education_data_fetcher.py) — no network.
+"""
+from __future__ import annotations
+
+import gzip
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import education_data_fetcher as fetcher  # noqa: E402
+
+CSV = (
+    b"time_period,geographic_level,school_type,attainment8_average\n"
+    b"202324,National,Total,45.9\n"
+    b"202425,National,Total,46.1\n"
+    b"202425,Regional,Total,44.0\n"
+)
+
+
+class TestReadCsvFile(unittest.TestCase):
+    def _read(self, body: bytes):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "body")
+            with open(path, "wb") as f:
+                f.write(body)
+            return fetcher._read_csv_file(path)
+
+    def test_plain_body(self):
+        df = self._read(CSV)
+        self.assertEqual(df["attainment8_average"].tolist(), [45.9, 46.1, 44.0])
+
+    def test_gzip_body_without_content_encoding(self):
+        df = self._read(gzip.compress(CSV))
+        self.assertEqual(df["attainment8_average"].tolist(), [45.9, 46.1, 44.0])
+
+    def test_iter_rows_of_gzip_body(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "body")
+            with open(path, "wb") as f:
+                f.write(gzip.compress(b"\xef\xbb\xbf" + CSV))
+            rows = list(fetcher._iter_csv_rows(path))
+        self.assertEqual([r["time_period"] for r in rows], ["202324", "202425", "202425"])
+        self.assertEqual(rows[1]["attainment8_average"], "46.1")
+
+
+class TestCalculateRagStatus(unittest.TestCase):
+    BOUNDARIES = {
+        "attainment8": [(5.5, "green"), (4.5, "amber"), (4.49, "red")],
+        "apprentice_starts": [(250000, "green"), (200000, "amber"), (199999, "red")],
+        "persistent_absence": [(9.99, "green"), (10.0, "amber"), (14.99, "amber"), (15.0, "red")],
+        "neet_rate": [(7.9, "green"), (8.0, "amber"), (12.0, "red")],
+    }
+
+    def test_band_boundaries(self):
+        for key, cases in self.BOUNDARIES.items():
+            for value, expected in cases:
+                self.assertEqual(fetcher.calculate_rag_status(key, value), expected, (key, value))
+
+    def test_unknown_metric_is_amber(self):
+        self.assertEqual(fetcher.calculate_rag_status("not_a_metric", 1.0), "amber")
+
+    def test_vectorised_neet_rate_bounds(self):
+        # Lower-is-better bounds are strict: exactly 8.0% NEET is amber, not green.
+        self.assertEqual(fetcher.calculate_rag_statuses("neet_rate", [7.99, 8.0, 12.0]), ["green", "amber", "red"])
+
+
+class TestEducationMetric(unittest.TestCase):
+    FIELDS = {
+        "metric_name": "Persistent Absence",
+        "metric_key": "persistent_absence",
+        "value": 10.0,
+        "time_period": "202324",
+        "data_source": "DfE: Pupil Absence",
+        "source_url": "https://example.gov.uk",
+    }
+
+    def test_fills_shared_fields_in_row_order(self):
+        metric = fetcher._education_metric({**self.FIELDS, "unit": "%"})
+        self.assertEqual(
+            list(metric),
+            ["metric_name", "metric_key", "category", "value", "rag_status", "time_period",
+             "data_source", "source_url", "last_updated", "unit"],
+        )
+        self.assertEqual(metric["category"], "Education")
+        self.assertEqual(metric["rag_status"], "amber")
+
+    def test_rag_value_overrides_the_rounded_value(self):
+        metric = fetcher._education_metric(self.FIELDS, rag_value=9.996)
+        self.assertEqual((metric["value"], metric["rag_status"]), (10.0, "green"))
+
+
+class TestPersistentAbsence(unittest.TestCase):
+    def _fetch(self, body: bytes):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "body")
+            with open(path, "wb") as f:
+                f.write(body)
+            with mock.patch.object(fetcher, "load_metric", return_value=None), \
+                    mock.patch.object(fetcher, "save_metric"), \
+                    mock.patch.object(fetcher, "cached_download", return_value=path):
+                return fetcher.fetch_persistent_absence_data()
+
+    def test_latest_total_phase_row(self):
+        metric = self._fetch(
+            b"time_period,geographic_level,education_phase,enrolments_pa_10_exact_percent\n"
+            b"202223,National,Total,21.2\n"
+            b"202324,National,Primary,14.0\n"
+            b"202324,National,Total,17.8\n"
+            b"202324,Regional,Total,30.0\n"
+        )
+        self.assertEqual((metric["time_period"], metric["value"]), ("202324", 17.8))
+
+    def test_blank_percentage_is_no_figure(self):
+        metric = self._fetch(
+            b"time_period,geographic_level,education_phase,enrolments_pa_10_exact_percent\n"
+            b"202324,National,Total,\n"
+        )
+        self.assertIsNone(metric)
+
+
+class TestFreshMetricCache(unittest.TestCase):
+    def test_reused_rows_carry_the_run_timestamp(self):
+        saved = {"metric_key": "persistent_absence", "value": 10.0, "last_updated": "2026-01-01T00:00:00"}
+        now = datetime(2026, 3, 1, 12, 0)
+        with mock.patch.object(fetcher, "load_metric", return_value=saved):
+            metric = fetcher.fetch_persistent_absence_data(now)
+        self.assertEqual(metric, {**saved, "last_updated": "2026-03-01T12:00:00"})
+        self.assertEqual(saved["last_updated"], "2026-01-01T00:00:00")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the on-disk HTTP download cache (http_cache.py).
+
+A fake session stands in for requests so the conditional-GET handshake
+(validators sent, 304 reuse, 200 replace) can be checked without network.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import http_cache  # noqa: E402
+
+
+class _FakeResponse:
+    def __init__(self, status_code, body=b"", headers=None):
+        self.status_code = status_code
+        self._body = body
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self._body), chunk_size):
+            yield self._body[i:i + chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, timeout=None, stream=False, headers=None):
+        self.calls.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+URL = "https://example.gov.uk/media/tables.xlsx"
+
+
+class TestCachedDownload(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _read(self, path):
+        with open(path, "rb") as f:
+            return f.read()
+
+    def test_first_download_stores_body_and_sends_no_validators(self):
+        session = _FakeSession([_FakeResponse(200, b"v1", {"ETag": '"a"'})])
+        path = http_cache.cached_download(session, URL, 10, cache_dir=self.cache_dir)
+        self.assertEqual(self._read(path), b"v1")
+        self.assertTrue(path.endswith(".xlsx"))
+        self.assertEqual(session.calls, [{}])
+
+    def test_304_reuses_cached_body(self):
+        session = _FakeSession([
+            _FakeResponse(200, b"v1", {"ETag": '"a"', "Last-Modified": "Mon, 01 Sep 2025 00:00:00 GMT"}),
+            _FakeResponse(304),
+        ])
+        http_cache.cached_download(session, URL, 10, cache_dir=self.cache_dir)
+        path = http_cache.cached_download(session, URL, 10, cache_dir=self.cache_dir)
+        self.assertEqual(self._read(path), b"v1")
+        self.assertEqual(session.calls[1]["If-None-Match"], '"a"')
+        self.assertEqual(session.calls[1]["If-Modified-Since"], "Mon, 01 Sep 2025 00:00:00 GMT")
+
+    def test_changed_upstream_replaces_body(self):
+        session = _FakeSession([
+            _FakeResponse(200, b"v1", {"ETag": '"a"'}),
+            _FakeResponse(200, b"v2", {"ETag": '"b"'}),
+            _FakeResponse(304),
+        ])
+        http_cache.cached_download(session, URL, 10, cache_dir=self.cache_dir)
+        path = http_cache.cached_download(session, URL, 10, cache_dir=self.cache_dir)
+        self.assertEqual(self._read(path), b"v2")
+        http_cache.cached_download(session, URL, 10, cache_dir=self.cache_dir)
+        self.assertEqual(session.calls[2]["If-None-Match"], '"b"')
+
+    def test_max_age_skips_the_request_while_fresh(self):
+        session = _FakeSession([_FakeResponse(200, b"v1", {"ETag": '"a"'}), _FakeResponse(304)])
+        http_cache.cached_download(session, URL, 10, cache_dir=self.cache_dir, max_age=3600)
+        path = http_cache.cached_download(session, URL, 10, cache_dir=self.cache_dir, max_age=3600)
+        self.assertEqual(self._read(path), b"v1")
+        self.assertEqual(len(session.calls), 1)
+        with mock.patch.object(http_cache.time, "time", return_value=time.time() + 7200):
+            http_cache.cached_download(session, URL, 10, cache_dir=self.cache_dir, max_age=3600)
+        self.assertEqual(session.calls[1]["If-None-Match"], '"a"')
+
+    def test_http_error_raises_and_leaves_no_partial_file(self):
+        session = _FakeSession([_FakeResponse(404)])
+        with self.assertRaises(RuntimeError):
+            http_cache.cached_download(session, URL, 10, cache_dir=self.cache_dir)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+
+class TestCachedParse(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.body_path = os.path.join(self._tmp.name, "series.csv")
+        self.calls = []
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, data):
+        with open(self.body_path, "wb") as f:
+            f.write(data)
+
+    def _parse(self, path):
+        self.calls.append(path)
+        with open(path, "rb") as f:
+            return [{"body": f.read().decode()}]
+
+    def test_unchanged_body_is_parsed_once(self):
+        self._write(b"v1")
+        first = http_cache.cached_parse(self.body_path, self._parse, "t1")
+        second = http_cache.cached_parse(self.body_path, self._parse, "t1")
+        self.assertEqual(first, [{"body": "v1"}])
+        self.assertEqual(second, first)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_new_body_or_version_reparses(self):
+        self._write(b"v1")
+        http_cache.cached_parse(self.body_path, self._parse, "t1")
+        self._write(b"v2")
+        self.assertEqual(http_cache.cached_parse(self.body_path, self._parse, "t1"), [{"body": "v2"}])
+        http_cache.cached_parse(self.body_path, self._parse, "t2")
+        self.assertEqual(len(self.calls), 3)
+
+    def test_corrupt_memo_is_reparsed(self):
+        self._write(b"v1")
+        with open(self.body_path + ".parsed.json", "w") as f:
+            f.write("{not json")
+        self.assertEqual(http_cache.cached_parse(self.body_path, self._parse, "t1"), [{"body": "v1"}])
+        self.assertEqual(len(self.calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
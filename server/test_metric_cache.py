@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the last-known-good metric cache (metric_cache.py).
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import metric_cache  # noqa: E402
+
+METRIC = {"metric_key": "charge_rate", "value": 7.3, "rag_status": "amber"}
+
+
+class TestMetricCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_missing_entry_is_none(self):
+        self.assertIsNone(metric_cache.load_metric("charge_rate", cache_dir=self.cache_dir))
+
+    def test_round_trip(self):
+        metric_cache.save_metric(METRIC, cache_dir=self.cache_dir)
+        self.assertEqual(metric_cache.load_metric("charge_rate", 6, cache_dir=self.cache_dir), METRIC)
+        self.assertEqual(os.listdir(self.cache_dir), ["charge_rate.json"])
+
+    def test_stale_entry_only_served_without_max_age(self):
+        metric_cache.save_metric(METRIC, cache_dir=self.cache_dir)
+        with mock.patch.object(metric_cache.time, "time", return_value=time.time() + 7 * 3600):
+            self.assertIsNone(metric_cache.load_metric("charge_rate", 6, cache_dir=self.cache_dir))
+            self.assertEqual(metric_cache.load_metric("charge_rate", cache_dir=self.cache_dir), METRIC)
+
+    def test_zero_max_age_never_short_circuits(self):
+        metric_cache.save_metric(METRIC, cache_dir=self.cache_dir)
+        self.assertIsNone(metric_cache.load_metric("charge_rate", 0, cache_dir=self.cache_dir))
+
+    def test_corrupt_entry_is_ignored(self):
+        with open(os.path.join(self.cache_dir, "charge_rate.json"), "w") as f:
+            f.write("{not json")
+        self.assertIsNone(metric_cache.load_metric("charge_rate", cache_dir=self.cache_dir))
+
+    def test_unserialisable_metric_leaves_no_partial_file(self):
+        metric_cache.save_metric({"metric_key": "charge_rate", "value": object()}, cache_dir=self.cache_dir)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared RAG classifier (rag.py).
+"""
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import rag  # noqa: E402
+
+THRESHOLDS = {
+    "higher": {"green": 10.0, "amber": 7.0},
+    "lower": {"green": 20.0, "amber": 30.0},
+}
+TABLE = rag.signed_table(THRESHOLDS, higher_is_better=("higher",))
+STRICT_TABLE = rag.signed_table(THRESHOLDS, higher_is_better=("higher",), strict_lower=True)
+
+
+class TestRagStatus(unittest.TestCase):
+    def test_higher_is_better_boundaries_are_inclusive(self):
+        self.assertEqual(
+            [rag.rag_status(TABLE, "higher", v) for v in (10.0, 7.0, 6.9)],
+            ["green", "amber", "red"],
+        )
+
+    def test_lower_is_better_boundaries_are_inclusive(self):
+        self.assertEqual(
+            [rag.rag_status(TABLE, "lower", v) for v in (20.0, 30.0, 30.1)],
+            ["green", "amber", "red"],
+        )
+
+    def test_strict_lower_boundaries_are_exclusive(self):
+        self.assertEqual(
+            [rag.rag_status(STRICT_TABLE, "lower", v) for v in (19.99, 20.0, 29.99, 30.0)],
+            ["green", "amber", "amber", "red"],
+        )
+        self.assertEqual(
+            [rag.rag_status(STRICT_TABLE, "higher", v) for v in (10.0, 7.0, 6.9)],
+            ["green", "amber", "red"],
+        )
+
+    def test_unknown_metric_is_amber(self):
+        self.assertEqual(rag.rag_status(TABLE, "other", 1.0), "amber")
+        self.assertEqual(rag.rag_statuses(TABLE, "other", [1.0, 2.0]), ["amber", "amber"])
+
+    def test_vectorised_matches_scalar(self):
+        values = [0.0, 6.9, 7.0, 10.0, 20.0, 25.0, 30.0, 31.0, float("nan")]
+        for table in (TABLE, STRICT_TABLE):
+            for key in THRESHOLDS:
+                self.assertEqual(
+                    rag.rag_statuses(table, key, values),
+                    [rag.rag_status(table, key, v) for v in values],
+                    key,
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()